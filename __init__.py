@@ -1,4 +1,10 @@
 from .word_utils import *
 from .data_structures import *
 from .algorithms import *
-from .gui import WordleSolverGUI
\ No newline at end of file
+
+def __getattr__(name):
+    # the GUI pulls in tkinter and matplotlib, so only import it when asked for
+    if name == 'WordleSolverGUI':
+        from .gui import WordleSolverGUI
+        return WordleSolverGUI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,143 @@
+import argparse
+import json
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from algorithms import NEXT_GUESS
+from feedback_matrix import FeedbackMatrix, NUM_PATTERNS, SOLVED_CODE, decode_feedback
+from word_utils import load_words
+
+MAX_TURNS = 20
+SHOWN_BUCKETS = 8
+
+@dataclass
+class Step:
+    guess: str
+    pattern: str
+    candidates: int
+    chosen: int
+    buckets: List[int]
+
+def _step(matrix: FeedbackMatrix, guess: int, code: int, counts: np.ndarray) -> Step:
+    sizes = np.sort(counts[counts > 0])[::-1]
+    return Step(matrix.words[guess], decode_feedback(code), int(counts.sum()), int(counts[code]), sizes.tolist())
+
+def adversarial_game(matrix: FeedbackMatrix, strategy: str, max_turns: int = MAX_TURNS) -> Tuple[List[Step], bool]:
+    """Absurdle-style game: the secret is never fixed, each feedback keeps the largest bucket.
+
+    Ties go to a bucket other than the solved one, then to the lowest pattern code.
+    Returns the steps and whether the strategy was allowed to finish within max_turns.
+    """
+    next_guess = NEXT_GUESS[strategy]
+    candidates = matrix.all_indices()
+    steps: List[Step] = []
+    while len(steps) < max_turns:
+        guess = next_guess(matrix, candidates, len(steps))
+        codes = matrix.table[guess, candidates]
+        counts = np.bincount(codes, minlength=NUM_PATTERNS)
+        preference = counts * 2
+        preference[SOLVED_CODE] -= 1
+        code = int(np.argmax(preference))
+        steps.append(_step(matrix, guess, code, counts))
+        if code == SOLVED_CODE:
+            return steps, True
+        candidates = candidates[codes == code]
+    return steps, False
+
+def worst_case(matrix: FeedbackMatrix, strategy: str, max_turns: int = MAX_TURNS) -> Dict:
+    """Exact worst case over the strategy's whole decision tree.
+
+    The tree is expanded one level at a time from the strategy's next-guess rule; every
+    node splits its candidates into feedback buckets with one table row gather and a
+    stable argsort, so no secret is ever played out on its own.
+    """
+    next_guess = NEXT_GUESS[strategy]
+    frontier: List[Tuple[np.ndarray, List[Step]]] = [(matrix.all_indices(), [])]
+    depths: Dict[int, int] = {}
+    worst_path: List[Step] = []
+    nodes = unsolved = 0
+    turn = 0
+    while frontier and turn < max_turns:
+        next_frontier = []
+        for candidates, path in frontier:
+            nodes += 1
+            guess = next_guess(matrix, candidates, turn)
+            codes = matrix.table[guess, candidates]
+            counts = np.bincount(codes, minlength=NUM_PATTERNS)
+            if counts[SOLVED_CODE]:
+                depths[turn + 1] = depths.get(turn + 1, 0) + 1
+                if turn + 1 > len(worst_path):
+                    worst_path = path + [_step(matrix, guess, SOLVED_CODE, counts)]
+            present = np.flatnonzero(counts)
+            buckets = np.split(candidates[np.argsort(codes, kind='stable')], np.cumsum(counts[present])[:-1])
+            for code, bucket in zip(present, buckets):
+                if code == SOLVED_CODE:
+                    continue
+                if len(bucket) == len(candidates):
+                    # the guess told nothing, so this rule would repeat it forever
+                    unsolved += len(bucket)
+                    continue
+                next_frontier.append((bucket, path + [_step(matrix, guess, int(code), counts)]))
+        frontier = next_frontier
+        turn += 1
+    unsolved += sum(len(candidates) for candidates, _ in frontier)
+    solved = sum(depths.values())
+    return {
+        'worst': max(depths) if depths else 0,
+        'path': worst_path,
+        'depth_histogram': dict(sorted(depths.items())),
+        'mean': sum(depth * count for depth, count in depths.items()) / solved if solved else 0.0,
+        'unsolved': unsolved,
+        'nodes': nodes
+    }
+
+def format_path(steps: List[Step]) -> str:
+    lines = []
+    for turn, step in enumerate(steps, 1):
+        shown = ' '.join(map(str, step.buckets[:SHOWN_BUCKETS]))
+        more = f" +{len(step.buckets) - SHOWN_BUCKETS} more" if len(step.buckets) > SHOWN_BUCKETS else ''
+        lines.append(f"    {turn:>2} {step.guess} {step.pattern} {step.candidates:>5} -> {step.chosen:<5}"
+                     f" {len(step.buckets):>3} buckets: {shown}{more}")
+    return '\n'.join(lines)
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Adversarial and exact worst-case guess counts per strategy")
+    parser.add_argument('--algorithm', action='append', choices=list(NEXT_GUESS), help="repeatable; defaults to all")
+    parser.add_argument('--words', default='five_letter_words.txt')
+    parser.add_argument('--guesses', help="allowed-guess list, if larger than the answer list")
+    parser.add_argument('--max-turns', type=int, default=MAX_TURNS)
+    parser.add_argument('--json', metavar='FILE', help="also write every path and histogram as JSON")
+    args = parser.parse_args(argv)
+
+    words = load_words(args.words)
+    matrix = FeedbackMatrix.load(words, guesses=load_words(args.guesses) if args.guesses else None)
+    report = {}
+    for name in args.algorithm or list(NEXT_GUESS):
+        start = time.perf_counter()
+        steps, finished = adversarial_game(matrix, name, args.max_turns)
+        adversary_time = time.perf_counter() - start
+        start = time.perf_counter()
+        exact = worst_case(matrix, name, args.max_turns)
+        exact_time = time.perf_counter() - start
+
+        print(name)
+        outcome = f"{len(steps)} guesses" if finished else f"not solved in {args.max_turns} guesses"
+        print(f"  Adversary: {outcome} ({adversary_time:.2f} s)")
+        print(format_path(steps))
+        unsolved = f", {exact['unsolved']} secrets unsolved" if exact['unsolved'] else ''
+        print(f"  Exact worst case: {exact['worst']} guesses, mean {exact['mean']:.3f}, {exact['nodes']} nodes"
+              f"{unsolved} ({exact_time:.2f} s)")
+        print(f"  Depths: {exact['depth_histogram']}")
+        print(format_path(exact['path']))
+        report[name] = {
+            'adversary': {'guesses': len(steps), 'finished': finished, 'seconds': adversary_time,
+                          'path': [asdict(step) for step in steps]},
+            'exact': {**exact, 'path': [asdict(step) for step in exact['path']], 'seconds': exact_time}
+        }
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -1,59 +1,103 @@
-import tkinter as tk
-from typing import List, Tuple, Dict
-from queue import PriorityQueue
-from data_structures import PrioritizedItem
+from typing import List, Tuple, Dict, Optional
+import numpy as np
+from aostar import get_planner
+from feedback_matrix import FeedbackMatrix, SOLVED_CODE
+from frequency_tracker import FrequencyTracker
+from hard_mode import HardModeConstraints, get_index
+from iddfs import get_search
+from scoring import entropy_scores, heuristic_scores, letter_counts
 from word_utils import (
     get_feedback, get_letter_frequencies, filter_words,
-    calculate_heuristic, calculate_g_cost
+    calculate_heuristic
 )
 
-def best_first_search(words: List[str], secret: str) -> Tuple[List[str], int]:
+def _matrix_candidates(words: List[str], matrix: FeedbackMatrix) -> np.ndarray:
+    if words is matrix.answers or words == matrix.answers:
+        return matrix.all_indices()
+    return matrix.indices(words)
+
+def _static_ranking(words: List[str], letter_freq: Dict[str, int], descending: bool = False) -> List[str]:
+    scores = {word: calculate_heuristic(word, letter_freq) for word in words}
+    if descending:
+        return sorted(words, key=lambda word: -scores[word])
+    return sorted(words, key=lambda word: (scores[word], word))
+
+def _matrix_ranking(words: List[str], matrix: FeedbackMatrix, descending: bool = False) -> np.ndarray:
     letter_freq = get_letter_frequencies(words)
-    pq = PriorityQueue()
-    possible_words = words.copy()
+    candidates = _matrix_candidates(words, matrix)
+    scores = heuristic_scores(matrix, candidates, letter_freq)
+    return candidates[np.lexsort((candidates, -scores if descending else scores))]
+
+# Hard mode only restricts guesses to words that reuse every revealed hint. Every remaining
+# candidate does, so solvers that only ever guess candidates (best-first, A*, DFS, IDDFS)
+# accept the hard_mode flag and need nothing else; Entropy and AO* Search restrict their
+# guess pools with a HardModeConstraints mask.
+
+def _ranked_search(ranked: List[str], secret: str) -> Tuple[List[str], int]:
     guesses = []
-    for word in possible_words:
-        pq.put((calculate_heuristic(word, letter_freq), word))
-    while not pq.empty() and len(guesses) < 6:
-        _, guess = pq.get()
+    while ranked and len(guesses) < 6:
+        guess = ranked[0]
         guesses.append(guess)
         feedback = get_feedback(secret, guess)
         if feedback == 'ggggg':
             return guesses, len(guesses)
-        possible_words = filter_words(possible_words, guess, feedback)
-        while not pq.empty():
-            pq.get()
-        for word in possible_words:
-            pq.put((calculate_heuristic(word, letter_freq), word))
+        ranked = filter_words(ranked, guess, feedback)
     return guesses, len(guesses)
 
-def astar_search(words: List[str], secret: str) -> Tuple[List[str], int]:
-    letter_freq = get_letter_frequencies(words)
-    pq = PriorityQueue()
-    possible_words = words.copy()
+def _ranked_matrix_search(ranked: np.ndarray, secret: str, matrix: FeedbackMatrix) -> Tuple[List[str], int]:
+    secret_idx = matrix.index_of(secret)
     guesses = []
-    for word in possible_words:
-        h_cost = calculate_heuristic(word, letter_freq)
-        g_cost = 0
-        f_cost = g_cost - h_cost
-        pq.put(PrioritizedItem(f_cost, g_cost, word))
-    while not pq.empty() and len(guesses) < 6:
-        current = pq.get()
-        guesses.append(current.word)
-        feedback = get_feedback(secret, current.word)
+    while len(ranked) and len(guesses) < 6:
+        guess = ranked[0]
+        guesses.append(matrix.words[guess])
+        code = matrix.table[guess, secret_idx]
+        if code == SOLVED_CODE:
+            return guesses, len(guesses)
+        ranked = filter_words(ranked, guess, code, matrix)
+    return guesses, len(guesses)
+
+def best_first_search(words: List[str], secret: str, matrix: Optional[FeedbackMatrix] = None,
+                      hard_mode: bool = False) -> Tuple[List[str], int]:
+    if matrix is not None:
+        return _ranked_matrix_search(_matrix_ranking(words, matrix), secret, matrix)
+    return _ranked_search(_static_ranking(words, get_letter_frequencies(words)), secret)
+
+def astar_search(words: List[str], secret: str, matrix: Optional[FeedbackMatrix] = None,
+                 hard_mode: bool = False) -> Tuple[List[str], int]:
+    # g is the same for every survivor of a turn, so f = g - h orders words by h alone;
+    # h is scored against the letter frequencies of the candidates still alive
+    if matrix is not None:
+        return _astar_matrix_search(words, secret, matrix)
+    tracker = FrequencyTracker(words)
+    guesses = []
+    while tracker.candidates and len(guesses) < 6:
+        guess = max(tracker.candidates, key=tracker.heuristic)
+        guesses.append(guess)
+        feedback = get_feedback(secret, guess)
         if feedback == 'ggggg':
             return guesses, len(guesses)
-        possible_words = filter_words(possible_words, current.word, feedback)
-        while not pq.empty():
-            pq.get()
-        g_cost = calculate_g_cost(guesses)
-        for word in possible_words:
-            h_cost = calculate_heuristic(word, letter_freq)
-            f_cost = g_cost - h_cost
-            pq.put(PrioritizedItem(f_cost, g_cost, word))
+        tracker.filter(guess, feedback)
     return guesses, len(guesses)
 
-def dfs_search(words: List[str], secret: str) -> Tuple[List[str], int]:
+def _astar_matrix_search(words: List[str], secret: str, matrix: FeedbackMatrix) -> Tuple[List[str], int]:
+    # a bincount over the candidates' letter codes is cheaper than keeping a FrequencyTracker in step
+    candidates = _matrix_candidates(words, matrix)
+    secret_idx = matrix.index_of(secret)
+    guesses = []
+    while len(candidates) and len(guesses) < 6:
+        letter_freq, _ = letter_counts(matrix, candidates)
+        guess = candidates[np.argmax(heuristic_scores(matrix, candidates, letter_freq))]
+        guesses.append(matrix.words[guess])
+        code = matrix.table[guess, secret_idx]
+        if code == SOLVED_CODE:
+            return guesses, len(guesses)
+        candidates = filter_words(candidates, guess, code, matrix)
+    return guesses, len(guesses)
+
+def dfs_search(words: List[str], secret: str, matrix: Optional[FeedbackMatrix] = None,
+               hard_mode: bool = False) -> Tuple[List[str], int]:
+    if matrix is not None:
+        return _dfs_matrix_search(words, secret, matrix)
     possible_words = words.copy()
     guesses = []
     def dfs_recursive(words: List[str], depth: int) -> bool:
@@ -72,25 +116,146 @@ def dfs_search(words: List[str], secret: str) -> Tuple[List[str], int]:
     dfs_recursive(possible_words, 0)
     return guesses, len(guesses)
 
-def aostar_search(words: List[str], secret: str) -> Tuple[List[str], int]:
-    letter_freq = get_letter_frequencies(words)
-    possible_words = words.copy()
+def _dfs_matrix_search(words: List[str], secret: str, matrix: FeedbackMatrix) -> Tuple[List[str], int]:
+    secret_idx = matrix.index_of(secret)
     guesses = []
-    costs: Dict[str, float] = {}
-    solved: Dict[str, bool] = {}
-    def get_cost(word: str) -> float:
-        if word not in costs:
-            costs[word] = calculate_heuristic(word, letter_freq)
-        return costs[word]
-    while possible_words and len(guesses) < 6:
-        current = min(possible_words, key=get_cost)
-        guesses.append(current)
-        feedback = get_feedback(secret, current)
-        if feedback == 'ggggg':
-            solved[current] = True
+    def dfs_recursive(candidates: np.ndarray, depth: int) -> bool:
+        if depth >= 6:
+            return False
+        codes = matrix.table[candidates, secret_idx]
+        for guess, code in zip(candidates.tolist(), codes.tolist()):
+            guesses.append(matrix.words[guess])
+            if code == SOLVED_CODE:
+                return True
+            remaining = filter_words(candidates, guess, code, matrix)
+            if len(remaining) and dfs_recursive(remaining, depth + 1):
+                return True
+            guesses.pop()
+        return False
+    dfs_recursive(_matrix_candidates(words, matrix), 0)
+    return guesses, len(guesses)
+
+def iddfs_search(words: List[str], secret: str, matrix: Optional[FeedbackMatrix] = None,
+                 hard_mode: bool = False) -> Tuple[List[str], int]:
+    if matrix is None:
+        matrix = FeedbackMatrix.load(words)
+    search = get_search(matrix)
+    candidates = _matrix_ranking(words, matrix, descending=True)
+    secret_idx = matrix.index_of(secret)
+    guesses = []
+    while len(candidates) and len(guesses) < 6:
+        guess, _ = search.best_guess(candidates, 6 - len(guesses))
+        guesses.append(matrix.words[guess])
+        code = matrix.table[guess, secret_idx]
+        if code == SOLVED_CODE:
+            return guesses, len(guesses)
+        candidates = filter_words(candidates, guess, code, matrix)
+    return guesses, len(guesses)
+
+def aostar_search(words: List[str], secret: str, matrix: Optional[FeedbackMatrix] = None,
+                  hard_mode: bool = False) -> Tuple[List[str], int]:
+    if matrix is None:
+        matrix = FeedbackMatrix.load(words)
+    planner = get_planner(matrix, hard_mode=hard_mode)
+    constraints = HardModeConstraints(get_index(matrix)) if hard_mode else None
+    candidates = _matrix_candidates(words, matrix)
+    secret_idx = matrix.index_of(secret)
+    guesses = []
+    while len(candidates) and len(guesses) < 6:
+        guess = planner.best_guess(candidates, allowed=constraints.allowed if hard_mode else None)
+        guesses.append(matrix.words[guess])
+        code = matrix.table[guess, secret_idx]
+        if code == SOLVED_CODE:
+            return guesses, len(guesses)
+        candidates = filter_words(candidates, guess, code, matrix)
+        if hard_mode:
+            constraints.add(matrix.words[guess], code)
+    return guesses, len(guesses)
+
+def best_entropy_guess(matrix: FeedbackMatrix, candidates: np.ndarray, guess_pool: Optional[np.ndarray] = None) -> int:
+    if len(candidates) <= 2:
+        return int(candidates[0])
+    full = len(candidates) == len(matrix.answers) and guess_pool is None
+    if full and 'entropy_opener' in matrix.memo:
+        return matrix.memo['entropy_opener']
+    scores = entropy_scores(matrix, candidates, guess_pool)
+    if guess_pool is None:
+        scores[candidates] += 1e-9
+        guess = int(np.argmax(scores))
+    else:
+        scores[np.isin(guess_pool, candidates)] += 1e-9
+        guess = int(guess_pool[np.argmax(scores)])
+    if full:
+        matrix.memo['entropy_opener'] = guess
+    return guess
+
+def entropy_search(words: List[str], secret: str, matrix: Optional[FeedbackMatrix] = None,
+                   hard_mode: bool = False) -> Tuple[List[str], int]:
+    if matrix is None:
+        matrix = FeedbackMatrix.load(words)
+    constraints = HardModeConstraints(get_index(matrix)) if hard_mode else None
+    candidates = _matrix_candidates(words, matrix)
+    secret_idx = matrix.index_of(secret)
+    guesses = []
+    while len(candidates) and len(guesses) < 6:
+        guess = best_entropy_guess(matrix, candidates, constraints.guess_pool() if hard_mode else None)
+        guesses.append(matrix.words[guess])
+        code = matrix.table[guess, secret_idx]
+        if code == SOLVED_CODE:
             return guesses, len(guesses)
-        possible_words = filter_words(possible_words, current, feedback)
-        solved[current] = False
-        for word in possible_words:
-            costs[word] = calculate_heuristic(word, letter_freq) + len(guesses)
-    return guesses, len(guesses)
\ No newline at end of file
+        candidates = filter_words(candidates, guess, code, matrix)
+        if hard_mode:
+            constraints.add(matrix.words[guess], code)
+    return guesses, len(guesses)
+
+def _dictionary_scores(matrix: FeedbackMatrix) -> np.ndarray:
+    if 'dictionary_scores' not in matrix.memo:
+        matrix.memo['dictionary_scores'] = heuristic_scores(matrix, matrix.all_indices(),
+                                                            get_letter_frequencies(matrix.answers))
+    return matrix.memo['dictionary_scores']
+
+# Next guess of each algorithm for a candidate index array (in dictionary order) after `turn`
+# guesses, without knowing the secret; each matches the guess its solver makes in that state.
+
+def _best_first_next(matrix: FeedbackMatrix, candidates: np.ndarray, turn: int) -> int:
+    return int(candidates[np.lexsort((candidates, _dictionary_scores(matrix)[candidates]))[0]])
+
+def _astar_next(matrix: FeedbackMatrix, candidates: np.ndarray, turn: int) -> int:
+    letter_freq, _ = letter_counts(matrix, candidates)
+    return int(candidates[np.argmax(heuristic_scores(matrix, candidates, letter_freq))])
+
+def _aostar_next(matrix: FeedbackMatrix, candidates: np.ndarray, turn: int) -> int:
+    return get_planner(matrix).best_guess(candidates)
+
+def _dfs_next(matrix: FeedbackMatrix, candidates: np.ndarray, turn: int) -> int:
+    return int(candidates[0])
+
+def _entropy_next(matrix: FeedbackMatrix, candidates: np.ndarray, turn: int) -> int:
+    return best_entropy_guess(matrix, candidates)
+
+def _iddfs_next(matrix: FeedbackMatrix, candidates: np.ndarray, turn: int) -> int:
+    ranked = candidates[np.lexsort((candidates, -_dictionary_scores(matrix)[candidates]))]
+    return get_search(matrix).best_guess(ranked, max(6 - turn, 1))[0]
+
+ALGORITHMS = {
+    "Best First Search": best_first_search,
+    "A* Search": astar_search,
+    "AO* Search": aostar_search,
+    "Depth First Search": dfs_search,
+    "Entropy Search": entropy_search,
+    "Iterative Deepening DFS": iddfs_search
+}
+
+NEXT_GUESS = {
+    "Best First Search": _best_first_next,
+    "A* Search": _astar_next,
+    "AO* Search": _aostar_next,
+    "Depth First Search": _dfs_next,
+    "Entropy Search": _entropy_next,
+    "Iterative Deepening DFS": _iddfs_next
+}
+
+# solvers whose guesses can depend on more than the secret and dictionary: IDDFS gives up on a
+# state after a wall-clock time limit, and its shared transposition table changes how far
+# the node budget reaches, so its results are not cached
+NONDETERMINISTIC = {"Iterative Deepening DFS"}
\ No newline at end of file
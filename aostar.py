@@ -0,0 +1,220 @@
+import argparse
+import hashlib
+import time
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from feedback_matrix import FeedbackMatrix, SOLVED_CODE
+from hard_mode import get_index, mask_fingerprint
+from scoring import entropy_scores
+from word_utils import load_words
+
+# OR-node expansions per planned state; best mean guess count over 64-1024 on five_letter_words.txt
+NODE_BUDGET = 128
+
+def lower_bound(size: int) -> float:
+    # guess a candidate now, then every other candidate is found on the next guess
+    return (2 * size - 1) / size
+
+def fingerprint(candidates: np.ndarray) -> bytes:
+    return hashlib.blake2b(candidates.astype(np.int32).tobytes(), digest_size=16).digest()
+
+class ORNode:
+    __slots__ = ('candidates', 'allowed', 'cost', 'solved', 'expanded', 'best', 'options', 'parents')
+
+    def __init__(self, candidates: np.ndarray, allowed: Optional[np.ndarray] = None):
+        self.candidates = candidates
+        self.allowed = allowed
+        size = len(candidates)
+        self.cost = lower_bound(size)
+        self.solved = size <= 2
+        self.expanded = False
+        self.best: Optional['ANDNode'] = None
+        self.options: List['ANDNode'] = []
+        self.parents: List['ANDNode'] = []
+
+class ANDNode:
+    __slots__ = ('guess', 'parent', 'children', 'cost', 'solved')
+
+    def __init__(self, guess: int, parent: ORNode, children: List[Tuple[float, ORNode]]):
+        self.guess = guess
+        self.parent = parent
+        self.children = children
+        self.update()
+
+    def update(self):
+        self.cost = 1 + sum(weight * child.cost for weight, child in self.children)
+        self.solved = all(child.solved for _, child in self.children)
+
+class AOStarPlanner:
+    """AO* over the AND-OR graph of guesses (OR) and feedback partitions (AND).
+
+    Node costs are expected guesses to finish; unexpanded nodes carry an admissible
+    lower bound, so a solved root is optimal over the guesses considered per node.
+    Candidate sets reached along different paths share one node via the
+    transposition table. In hard mode each OR node also carries the mask of guesses
+    that reuse every hint on its path, and nodes are keyed by both.
+
+    best_guess plans every state from an empty graph with a fixed expansion budget,
+    so its answer depends only on the state, never on games solved before; those
+    answers are memoized per state.
+    """
+
+    def __init__(self, matrix: FeedbackMatrix, guess_limit: int = 10, hard_mode: bool = False):
+        self.matrix = matrix
+        self.guess_limit = guess_limit
+        self.hard_mode = hard_mode
+        self.index = get_index(matrix) if hard_mode else None
+        self.table: Dict[bytes, ORNode] = {}
+        self.decisions: Dict[bytes, int] = {}
+        self.or_nodes = 0
+        self.nodes_expanded = 0
+        self.and_nodes = 0
+        self.lookups = 0
+        self.hits = 0
+        self.elapsed = 0.0
+
+    @staticmethod
+    def state_key(candidates: np.ndarray, allowed: Optional[np.ndarray] = None) -> bytes:
+        key = fingerprint(candidates)
+        return key + mask_fingerprint(allowed) if allowed is not None else key
+
+    def node(self, candidates: np.ndarray, allowed: Optional[np.ndarray] = None) -> ORNode:
+        key = self.state_key(candidates, allowed)
+        self.lookups += 1
+        node = self.table.get(key)
+        if node is None:
+            node = self.table[key] = ORNode(candidates, allowed)
+            self.or_nodes += 1
+        else:
+            self.hits += 1
+        return node
+
+    def _options(self, candidates: np.ndarray, allowed: Optional[np.ndarray] = None) -> np.ndarray:
+        if allowed is None:
+            scores = entropy_scores(self.matrix, candidates)
+        else:
+            pool = np.flatnonzero(allowed)
+            scores = np.full(len(self.matrix), -np.inf)
+            scores[pool] = entropy_scores(self.matrix, candidates, pool)
+        scores[candidates] += 1 / len(candidates)
+        limit = min(self.guess_limit, len(scores) if allowed is None else int(allowed.sum()))
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        return top[np.argsort(-scores[top], kind='stable')]
+
+    def expand(self, node: ORNode):
+        size = len(node.candidates)
+        for guess in self._options(node.candidates, node.allowed).tolist():
+            buckets = self.matrix.partition(guess, node.candidates)
+            if len(buckets) == 1 and SOLVED_CODE not in buckets:
+                continue
+            children = [(len(bucket) / size, self.node(bucket, self._child_allowed(node, guess, code)))
+                        for code, bucket in buckets.items() if code != SOLVED_CODE]
+            option = ANDNode(guess, node, children)
+            for _, child in children:
+                child.parents.append(option)
+            node.options.append(option)
+            self.and_nodes += 1
+        node.expanded = True
+        self.nodes_expanded += 1
+        self._revise(node)
+
+    def _child_allowed(self, node: ORNode, guess: int, code: int) -> Optional[np.ndarray]:
+        if node.allowed is None:
+            return None
+        return node.allowed & self.index.hint_mask(self.matrix.words[guess], code)
+
+    def _revise(self, node: ORNode) -> bool:
+        best = min(node.options, key=lambda option: option.cost)
+        changed = best is not node.best or best.cost != node.cost or best.solved != node.solved
+        node.best = best
+        node.cost = best.cost
+        node.solved = best.solved
+        return changed
+
+    def _backup(self, node: ORNode):
+        pending = [node]
+        while pending:
+            child = pending.pop()
+            for option in child.parents:
+                option.update()
+                if self._revise(option.parent):
+                    pending.append(option.parent)
+
+    def _select_tip(self, root: ORNode) -> ORNode:
+        node = root
+        while node.expanded:
+            node = max((child for _, child in node.best.children if not child.solved),
+                       key=lambda child: len(child.candidates))
+        return node
+
+    def plan(self, candidates: np.ndarray, time_limit: Optional[float] = None,
+             node_limit: Optional[int] = None, allowed: Optional[np.ndarray] = None) -> ORNode:
+        start = time.perf_counter()
+        if self.hard_mode and allowed is None:
+            allowed = np.ones(len(self.matrix), dtype=bool)
+        root = self.node(candidates, allowed if self.hard_mode else None)
+        expansions = 0
+        while not root.solved:
+            if node_limit is not None and expansions >= node_limit:
+                break
+            if time_limit is not None and time.perf_counter() - start >= time_limit:
+                break
+            tip = self._select_tip(root)
+            self.expand(tip)
+            self._backup(tip)
+            expansions += 1
+        self.elapsed += time.perf_counter() - start
+        return root
+
+    def best_guess(self, candidates: np.ndarray, node_limit: int = NODE_BUDGET,
+                   allowed: Optional[np.ndarray] = None) -> int:
+        if len(candidates) <= 2:
+            return int(candidates[0])
+        if self.hard_mode and allowed is None:
+            allowed = np.ones(len(self.matrix), dtype=bool)
+        key = self.state_key(candidates, allowed if self.hard_mode else None) + node_limit.to_bytes(4, 'little')
+        if key not in self.decisions:
+            # a graph left over from another state would change which tips the budget reaches
+            self.table = {}
+            self.decisions[key] = self.plan(candidates, node_limit=node_limit, allowed=allowed).best.guess
+        return self.decisions[key]
+
+    def stats(self) -> Dict:
+        return {
+            'nodes_expanded': self.nodes_expanded,
+            'and_nodes': self.and_nodes,
+            'or_nodes': self.or_nodes,
+            'decisions': len(self.decisions),
+            'cache_lookups': self.lookups,
+            'cache_hits': self.hits,
+            'cache_hit_rate': self.hits / self.lookups if self.lookups else 0.0,
+            'elapsed_s': self.elapsed
+        }
+
+def get_planner(matrix: FeedbackMatrix, guess_limit: int = 10, hard_mode: bool = False) -> AOStarPlanner:
+    key = ('aostar_planner', guess_limit, hard_mode)
+    if key not in matrix.memo:
+        matrix.memo[key] = AOStarPlanner(matrix, guess_limit, hard_mode)
+    return matrix.memo[key]
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Compute the minimum expected-guess strategy with AO*")
+    parser.add_argument('--words', default='five_letter_words.txt')
+    parser.add_argument('--guess-limit', type=int, default=10, help="guesses considered at each OR node")
+    parser.add_argument('--time-limit', type=float, default=300.0, help="seconds")
+    parser.add_argument('--node-limit', type=int, help="maximum OR-node expansions")
+    parser.add_argument('--hard-mode', action='store_true', help="only consider guesses that reuse every hint")
+    args = parser.parse_args(argv)
+
+    words = load_words(args.words)
+    matrix = FeedbackMatrix.load(words)
+    planner = AOStarPlanner(matrix, args.guess_limit, args.hard_mode)
+    root = planner.plan(matrix.all_indices(), args.time_limit, args.node_limit)
+    print(f"Opener: {words[root.best.guess]}")
+    status = f"optimal over the top {args.guess_limit} guesses per node" if root.solved else "lower bound, budget exhausted"
+    print(f"Expected guesses: {root.cost:.4f} ({status})")
+    for key, value in planner.stats().items():
+        print(f"{key}: {value}")
+
+if __name__ == '__main__':
+    main()
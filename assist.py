@@ -0,0 +1,108 @@
+import re
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from algorithms import NEXT_GUESS
+from bitset_filter import BitsetFilter
+from feedback_matrix import FeedbackMatrix
+from word_utils import WORD_LENGTH
+
+DEFAULT_ALGORITHM = "Entropy Search"
+_GUESS = re.compile(r'^[a-z]{5}$')
+_FEEDBACK = re.compile(r'^[byg]{5}$')
+
+def get_engine(matrix: FeedbackMatrix) -> BitsetFilter:
+    if 'bitset_filter' not in matrix.memo:
+        matrix.memo['bitset_filter'] = BitsetFilter(matrix.answers)
+    return matrix.memo['bitset_filter']
+
+class AssistSession:
+    """Helps play a live game: the secret is unknown, only the guesses and their colors.
+
+    Each step ANDs the current candidate bitset with the mask of the new constraint and
+    pushes the result, so undo and redo just move bitsets between two stacks instead of
+    filtering again from the full list. Suggestions are cached per (algorithm, turn, candidates).
+    """
+
+    def __init__(self, words: List[str], matrix: Optional[FeedbackMatrix] = None,
+                 algorithm: str = DEFAULT_ALGORITHM):
+        self.matrix = matrix if matrix is not None else FeedbackMatrix.load(words)
+        self.engine = get_engine(self.matrix)
+        self.algorithm = algorithm
+        self._steps: List[Tuple[str, str, int]] = []
+        self._redo: List[Tuple[str, str, int]] = []
+        self._suggestions: Dict[Tuple[str, int, int], int] = {}
+
+    @property
+    def bits(self) -> int:
+        return self._steps[-1][2] if self._steps else self.engine.full
+
+    @property
+    def candidates(self) -> np.ndarray:
+        return self.engine.bitset_indices(self.bits)
+
+    @property
+    def candidate_words(self) -> List[str]:
+        return self.matrix.to_words(self.candidates)
+
+    @property
+    def history(self) -> List[Tuple[str, str]]:
+        return [(guess, feedback) for guess, feedback, _ in self._steps]
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._steps)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def apply(self, guess: str, feedback: str) -> int:
+        """Record a guess and its colors (g/y/b); returns the number of candidates left."""
+        guess, feedback = guess.strip().lower(), feedback.strip().lower()
+        if not _GUESS.match(guess):
+            raise ValueError(f"Guess must be {WORD_LENGTH} letters")
+        if not _FEEDBACK.match(feedback):
+            raise ValueError(f"Colors must be {WORD_LENGTH} of g (green), y (yellow) or b (gray)")
+        if self.matrix.has_guess_list and guess not in self.matrix.index:
+            raise ValueError(f"{guess!r} is not in the allowed guess list")
+        bits = self.bits & self.engine.constraint_mask(guess, feedback)
+        self._steps.append((guess, feedback, bits))
+        self._redo.clear()
+        return bin(bits).count('1')
+
+    def undo(self) -> bool:
+        if not self._steps:
+            return False
+        self._redo.append(self._steps.pop())
+        return True
+
+    def redo(self) -> bool:
+        if not self._redo:
+            return False
+        self._steps.append(self._redo.pop())
+        return True
+
+    def reset(self):
+        self._steps.clear()
+        self._redo.clear()
+
+    def suggestion_key(self, algorithm: Optional[str] = None) -> Tuple[str, int, int]:
+        return algorithm or self.algorithm, len(self._steps), self.bits
+
+    def cached_suggestion(self, algorithm: Optional[str] = None) -> Optional[str]:
+        """The suggestion for the current state if it was already computed, else None."""
+        guess = self._suggestions.get(self.suggestion_key(algorithm))
+        return self.matrix.words[guess] if guess is not None else None
+
+    def remember_suggestion(self, key: Tuple[str, int, int], guess: int):
+        """Store a suggestion computed elsewhere (e.g. in a worker process) for the state key."""
+        self._suggestions[key] = guess
+
+    def suggest(self, algorithm: Optional[str] = None) -> Optional[str]:
+        """Next guess of the algorithm for the current candidates, or None if nothing matches."""
+        key = self.suggestion_key(algorithm)
+        if not key[2]:
+            return None
+        if key not in self._suggestions:
+            self._suggestions[key] = NEXT_GUESS[key[0]](self.matrix, self.candidates, key[1])
+        return self.matrix.words[self._suggestions[key]]
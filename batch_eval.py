@@ -0,0 +1,168 @@
+import argparse
+import csv
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+from algorithms import ALGORITHMS
+from feedback_matrix import FeedbackMatrix
+from result_cache import ResultCache
+from solver_pool import init_worker, solve_in_worker
+from timing import percentile
+from word_utils import load_words
+
+HARD_MODE_SUFFIX = ' (hard)'
+
+Row = Tuple[str, int, bool, int, bool]
+
+def _row(secret: str, guesses: List[str], elapsed: float, cached: bool = False) -> Row:
+    return secret, len(guesses), bool(guesses) and guesses[-1] == secret, int(elapsed * 1e9), cached
+
+def _solve_chunk(name: str, secrets: List[str], hard_mode: bool = False) -> Tuple[str, bool, List[Tuple[str, List[str], float]]]:
+    return name, hard_mode, [(secret, *solve_in_worker(name, secret, hard_mode=hard_mode)) for secret in secrets]
+
+def summarize(rows: List[Row]) -> Dict:
+    """Guess statistics over every row; latency statistics over the fresh solves only.
+
+    Cached rows carry the latency of the run that stored them, so mixing them in would
+    report old timings. With no fresh solves the latency fields are None.
+    """
+    histogram: Dict[str, int] = {}
+    for _, count, solved, _, _ in rows:
+        key = str(count) if solved else 'failed'
+        histogram[key] = histogram.get(key, 0) + 1
+    fresh = [(count, elapsed / 1e6) for _, count, _, elapsed, cached in rows if not cached]
+    latencies = [ms for _, ms in fresh]
+    solved_counts = [count for _, count, solved, _, _ in rows if solved]
+    failures = len(rows) - len(solved_counts)
+    return {
+        'secrets': len(rows),
+        'cached': len(rows) - len(fresh),
+        'histogram': dict(sorted(histogram.items())),
+        'failures': failures,
+        'failure_rate': failures / len(rows) if rows else 0.0,
+        'mean_guesses': statistics.mean(solved_counts) if solved_counts else None,
+        'mean_ms': statistics.mean(latencies) if latencies else None,
+        'ms_per_guess': sum(latencies) / sum(count for count, _ in fresh) if fresh else None,
+        'p50_ms': percentile(latencies, 50) if latencies else None,
+        'p99_ms': percentile(latencies, 99) if latencies else None,
+        'total_solve_s': sum(latencies) / 1e3
+    }
+
+def run_batch(secrets: List[str], algorithms: List[str], words_path: str = 'five_letter_words.txt',
+              workers: Optional[int] = None, chunk_size: int = 64, use_matrix: bool = True,
+              hard_modes: Tuple[bool, ...] = (False,), guesses_path: Optional[str] = None,
+              use_cache: bool = True) -> Dict:
+    """Solve every secret with every algorithm, once per entry of hard_modes.
+
+    With use_cache, games already in the result cache are read back instead of solved
+    (only on the matrix path) and new ones are stored. Cached rows are marked and left
+    out of the latency statistics, which describe this run's solves.
+    """
+    words = load_words(words_path)
+    guesses = load_words(guesses_path) if guesses_path else None
+    if use_matrix:
+        FeedbackMatrix.load(words, guesses=guesses)
+    cache = ResultCache(words, guesses) if use_cache and use_matrix else None
+    labels = [name + HARD_MODE_SUFFIX if hard else name for hard in hard_modes for name in algorithms]
+    rows: Dict[str, List] = {label: [] for label in labels}
+    units = []
+    for hard in hard_modes:
+        for name in algorithms:
+            cached = cache.get_many(name, secrets, hard) if cache is not None else {}
+            rows[name + HARD_MODE_SUFFIX if hard else name].extend(
+                _row(secret, *cached[secret], cached=True) for secret in secrets if secret in cached)
+            todo = [secret for secret in secrets if secret not in cached]
+            units.extend((name, todo[i:i + chunk_size], hard) for i in range(0, len(todo), chunk_size))
+    start = time.perf_counter()
+    if units:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                 initargs=(words, use_matrix, guesses)) as pool:
+            futures = [pool.submit(_solve_chunk, name, chunk, hard) for name, chunk, hard in units]
+            for future in as_completed(futures):
+                name, hard, solved = future.result()
+                rows[name + HARD_MODE_SUFFIX if hard else name].extend(_row(*result) for result in solved)
+                if cache is not None:
+                    cache.put_many([(name, secret, played, elapsed, hard) for secret, played, elapsed in solved])
+    wall = time.perf_counter() - start
+    if cache is not None:
+        cache.close()
+    return {
+        'wall_time_s': wall,
+        'workers': workers or os.cpu_count(),
+        'chunk_size': chunk_size,
+        'cache': dict(cache.stats) if cache is not None else None,
+        'algorithms': {label: summarize(rows[label]) for label in labels},
+        'rows': rows
+    }
+
+def write_csv(report: Dict, path: str):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        # latency_ms of a cached row is the stored timing of the run that solved it
+        writer.writerow(['algorithm', 'secret', 'guesses', 'solved', 'latency_ms', 'cached'])
+        for name, rows in report['rows'].items():
+            for secret, count, solved, elapsed, cached in sorted(rows):
+                writer.writerow([name, secret, count, int(solved), f"{elapsed / 1e6:.3f}", int(cached)])
+
+def _ms(value: Optional[float], width: int, digits: int) -> str:
+    return f"{value:>{width}.{digits}f}" if value is not None else f"{'-':>{width}}"
+
+def print_summary(report: Dict):
+    print(f"{'Algorithm':<31} {'mean':>6} {'fail%':>7} {'fresh':>7} {'cached':>7} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'ms/guess':>9}  histogram")
+    for name, summary in report['algorithms'].items():
+        mean = summary['mean_guesses']
+        print(f"{name:<31} {mean if mean is not None else float('nan'):>6.3f} {summary['failure_rate'] * 100:>6.2f}%"
+              f" {summary['secrets'] - summary['cached']:>7} {summary['cached']:>7}"
+              f" {_ms(summary['p50_ms'], 8, 2)} {_ms(summary['p99_ms'], 8, 2)} {_ms(summary['ms_per_guess'], 9, 3)}"
+              f"  {summary['histogram']}")
+    if any(summary['cached'] for summary in report['algorithms'].values()):
+        print("Latency columns cover the fresh solves only; cached games count toward the guess statistics")
+    print(f"Wall time: {report['wall_time_s']:.2f} s on {report['workers']} workers")
+    if report['cache'] is not None:
+        stats = report['cache']
+        print(f"Result cache: {stats['memory_hits'] + stats['disk_hits']} hits, {stats['misses']} misses, "
+              f"{stats['stores']} stored, {stats['uncacheable']} not cacheable")
+
+HARD_MODES = {'off': (False,), 'on': (True,), 'both': (False, True)}
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Solve every word in the dictionary with each algorithm")
+    parser.add_argument('--words', default='five_letter_words.txt', help="dictionary file")
+    parser.add_argument('--guesses', help="allowed-guess list, if larger than the answer list (needs the matrix)")
+    parser.add_argument('--secrets', help="file with the subset of secrets to solve (defaults to the dictionary)")
+    parser.add_argument('--limit', type=int, help="only solve the first N secrets")
+    parser.add_argument('--algorithm', action='append', choices=list(ALGORITHMS), help="repeatable; defaults to all")
+    parser.add_argument('--workers', type=int, help="process count (defaults to cpu count)")
+    parser.add_argument('--chunk-size', type=int, default=64)
+    parser.add_argument('--no-matrix', action='store_true', help="use the string-based get_feedback path")
+    parser.add_argument('--hard-mode', choices=['off', 'on', 'both'], default='off',
+                        help="'both' solves every secret in normal and hard mode for comparison")
+    parser.add_argument('--no-cache', action='store_true', help="solve every game instead of reading the result cache")
+    parser.add_argument('--json', help="write the summary report to this path")
+    parser.add_argument('--csv', help="write per-secret rows to this path")
+    args = parser.parse_args(argv)
+
+    if args.guesses and args.no_matrix:
+        parser.error("--guesses needs the feedback matrix")
+    secrets = load_words(args.secrets or args.words)
+    unknown = set(secrets).difference(load_words(args.words))
+    if unknown:
+        parser.error(f"secrets not in {args.words}: {', '.join(sorted(unknown)[:5])}")
+    if args.limit:
+        secrets = secrets[:args.limit]
+    report = run_batch(secrets, args.algorithm or list(ALGORITHMS), args.words,
+                       args.workers, args.chunk_size, not args.no_matrix, HARD_MODES[args.hard_mode], args.guesses,
+                       not args.no_cache)
+    print_summary(report)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({k: v for k, v in report.items() if k != 'rows'}, f, indent=2)
+    if args.csv:
+        write_csv(report, args.csv)
+
+if __name__ == '__main__':
+    main()
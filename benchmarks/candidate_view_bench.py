@@ -0,0 +1,38 @@
+import random
+import time
+from algorithms import entropy_search
+from candidate_browser import CandidateView
+from feedback_matrix import FeedbackMatrix
+from word_utils import load_words
+
+VISIBLE_ROWS = 30
+REPEATS = 200
+
+def per_call_us(func, repeats: int = REPEATS) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats * 1e6
+
+def main():
+    words = load_words()
+    matrix = FeedbackMatrix.load(words)
+    view = CandidateView(matrix)
+    secret = random.Random(0).choice(words)
+    guesses, _ = entropy_search(words, secret, matrix=matrix)
+    print(f"Full list of {len(words)} words, then the turns of {secret!r}: {' '.join(guesses)}")
+
+    print(f"set_game:               {per_call_us(lambda: view.set_game(guesses, secret)):10.1f} us")
+    view.set_game(guesses, secret)
+    view.select(sort_key='Score')
+    print(f"sort by score (cached): {per_call_us(lambda: view.select(sort_key='Score')):10.1f} us")
+    print(f"prefix filter 'st':     {per_call_us(lambda: view.select(prefix='st')):10.1f} us")
+    view.select(prefix='')
+    rng = random.Random(1)
+    positions = iter([rng.randrange(len(view) - VISIBLE_ROWS) for _ in range(REPEATS)])
+    print(f"window of {VISIBLE_ROWS} rows:      {per_call_us(lambda: view.window(next(positions), VISIBLE_ROWS)):10.1f} us")
+    print(f"whole list as rows:     {per_call_us(lambda: view.window(0, len(view)), 20):10.1f} us "
+          f"(what a full Treeview fill would have to format before inserting {len(view)} items)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+import argparse
+import importlib
+import os
+import random
+import resource
+import sys
+import tkinter as tk
+from typing import Dict, List
+
+COMPARISONS = 100
+WARMUP = 10
+
+def rss_mb() -> float:
+    """Current resident set size; falls back to the peak where /proc is not available."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+def fake_results(names: List[str], rng: random.Random) -> Dict[str, Dict[str, List[float]]]:
+    # every fifth comparison is a multi-secret run, so the distribution panels change too
+    runs = 20 if rng.random() < 0.2 else 1
+    return {name: {'time': [rng.uniform(0.001, 2.0) for _ in range(runs)],
+                   'guesses': [rng.randint(2, 8) for _ in range(runs)]} for name in names}
+
+def check(module_name: str, comparisons: int, rng: random.Random) -> float:
+    module = importlib.import_module(module_name)
+    root = tk.Tk()
+    app = module.WordleSolverGUI(root)
+    names = list(app.algorithms)
+    samples = []
+    for i in range(comparisons):
+        app.show_comparison_chart(fake_results(names, rng))
+        root.update()
+        if i + 1 == WARMUP or (i + 1) % 25 == 0:
+            samples.append((i + 1, rss_mb()))
+    app.close()
+    print(f"{module_name}: " + ', '.join(f"{count}: {mb:.1f} MB" for count, mb in samples))
+    return samples[-1][1] - samples[0][1]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="RSS across consecutive comparison-chart updates in the GUIs")
+    parser.add_argument('--gui', action='append', choices=['gui', 'gui2'], help="repeatable; defaults to both")
+    parser.add_argument('--comparisons', type=int, default=COMPARISONS)
+    parser.add_argument('--tolerance', type=float, default=5.0, metavar='MB',
+                        help="largest allowed growth after the warm-up comparisons")
+    args = parser.parse_args(argv)
+    rng = random.Random(0)
+    failed = False
+    for name in args.gui or ['gui', 'gui2']:
+        growth = check(name, args.comparisons, rng)
+        print(f"  growth after warm-up: {growth:+.1f} MB (tolerance {args.tolerance:.1f} MB)")
+        failed |= growth > args.tolerance
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
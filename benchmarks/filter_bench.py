@@ -0,0 +1,30 @@
+import random
+import timeit
+from bitset_filter import BitsetFilter
+from word_utils import load_words, get_feedback, filter_words
+
+SIZES = [3115, 1000, 300, 100, 30, 10, 2]
+
+def time_per_call(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+def main():
+    words = load_words()
+    engine = BitsetFilter(words)
+    rng = random.Random(0)
+    print(f"{'size':>6} {'filter_words':>14} {'bitset list':>14} {'bitset int':>14}")
+    for size in SIZES:
+        size = min(size, len(words))
+        subset = words if size == len(words) else [words[i] for i in sorted(rng.sample(range(len(words)), size))]
+        bits = engine.to_bitset(subset)
+        guess, secret = rng.choice(words), rng.choice(subset)
+        feedback = get_feedback(secret, guess)
+        assert engine.filter_words(subset, guess, feedback) == filter_words(subset, guess, feedback)
+        number = max(10, 30000 // size)
+        baseline = time_per_call(lambda: filter_words(subset, guess, feedback), number)
+        as_list = time_per_call(lambda: engine.filter_words(subset, guess, feedback), number)
+        as_bits = time_per_call(lambda: engine.filter_bits(bits, guess, feedback), number)
+        print(f"{size:>6} {baseline:>12.1f}us {as_list:>12.1f}us {as_bits:>12.1f}us")
+
+if __name__ == '__main__':
+    main()
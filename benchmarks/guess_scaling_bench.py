@@ -0,0 +1,55 @@
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import List
+import numpy as np
+from algorithms import best_entropy_guess
+from feedback_matrix import FeedbackMatrix
+from scoring import entropy_scores
+from word_utils import load_words
+
+SIZES = [3116, 6000, 9000, 13000]
+
+def synthetic_guesses(answers: List[str], size: int, seed: int = 0) -> List[str]:
+    """Extra guess words drawn letter by letter from the answers' positional letter frequencies."""
+    rng = random.Random(seed)
+    columns = [[word[i] for word in answers] for i in range(len(answers[0]))]
+    guesses = set(answers)
+    while len(guesses) < size:
+        guesses.add(''.join(rng.choice(column) for column in columns))
+    return sorted(guesses)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Feedback-table and entropy cost as the guess list grows")
+    parser.add_argument('--words', default='five_letter_words.txt', help="answer list")
+    parser.add_argument('--guesses', help="real allowed-guess list; its size is added to the synthetic sizes")
+    args = parser.parse_args(argv)
+    answers = load_words(args.words)
+    pools = [(size, synthetic_guesses(answers, size)) for size in SIZES]
+    if args.guesses:
+        real = load_words(args.guesses)
+        pools.append((len(set(real) | set(answers)), real))
+    rng = np.random.default_rng(0)
+    mid = np.sort(rng.choice(len(answers), 100, replace=False))
+    print(f"{'guesses':>8} {'table MB':>9} {'build s':>8} {'peak MB':>8} {'opener s':>9} {'100 cand ms':>12}")
+    for size, guesses in pools:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            tracemalloc.start()
+            start = time.perf_counter()
+            matrix = FeedbackMatrix.load(answers, cache_dir, guesses)
+            build = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            start = time.perf_counter()
+            best_entropy_guess(matrix, matrix.all_indices())
+            opener = time.perf_counter() - start
+            start = time.perf_counter()
+            entropy_scores(matrix, mid)
+            scoring = time.perf_counter() - start
+            print(f"{len(matrix):>8} {matrix.table.nbytes / 2**20:>9.1f} {build:>8.2f} {peak / 2**20:>8.1f}"
+                  f" {opener:>9.2f} {scoring * 1e3:>12.2f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+import random
+import timeit
+from feedback_matrix import FeedbackMatrix
+from scoring import heuristic_scores, letter_counts
+from word_utils import load_words, get_letter_frequencies, calculate_heuristic, calculate_positional_heuristic
+
+SIZES = [3115, 300, 30]
+
+def time_per_call(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+def main():
+    words = load_words()
+    matrix = FeedbackMatrix.load(words)
+    heuristic_scores(matrix, matrix.all_indices()[:1], {})  # build the letter tables outside the timings
+    rng = random.Random(0)
+    print(f"{'size':>6} {'per word':>12} {'batched':>12} {'speedup':>8} {'pos per word':>13} {'pos batched':>12} {'speedup':>8}")
+    for size in SIZES:
+        size = min(size, len(words))
+        candidates = matrix.all_indices()[sorted(rng.sample(range(len(words)), size))]
+        subset = matrix.to_words(candidates)
+        letter_freq = get_letter_frequencies(subset)
+        position_freq = [get_letter_frequencies([word[i] for word in subset]) for i in range(len(subset[0]))]
+        overall, positional = letter_counts(matrix, candidates)
+        number = max(10, 30000 // size)
+        per_word = time_per_call(lambda: [calculate_heuristic(word, letter_freq) for word in subset], number)
+        batched = time_per_call(lambda: heuristic_scores(matrix, candidates, overall), number)
+        pos_per_word = time_per_call(lambda: [calculate_positional_heuristic(word, position_freq) for word in subset],
+                                     number)
+        pos_batched = time_per_call(lambda: heuristic_scores(matrix, candidates, positional, positional=True), number)
+        print(f"{size:>6} {per_word:>10.1f}us {batched:>10.1f}us {per_word / batched:>7.1f}x"
+              f" {pos_per_word:>11.1f}us {pos_batched:>10.1f}us {pos_per_word / pos_batched:>7.1f}x")
+
+if __name__ == '__main__':
+    main()
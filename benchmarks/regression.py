@@ -0,0 +1,148 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from algorithms import ALGORITHMS
+from feedback_matrix import FeedbackMatrix
+from word_utils import load_words, get_feedback, get_letter_frequencies, filter_words, calculate_heuristic, words_hash
+
+BASELINE_PATH = os.path.join('benchmarks', 'baseline.json')
+DEFAULT_THRESHOLD = 25.0
+SAMPLE_SIZE = 25
+SWEEP_ALGORITHMS = ('Best First Search', 'A* Search', 'Entropy Search')
+MIN_TIME = 1.0
+
+def sample_secrets(words: List[str], size: int) -> List[str]:
+    """Evenly spaced secrets, so the sample only changes when the word list does."""
+    step = max(1, len(words) // size)
+    return words[::step][:size]
+
+def search_case(name: str, words: List[str], secrets: List[str], matrix: FeedbackMatrix) -> Callable:
+    algo_func = ALGORITHMS[name]
+
+    def run() -> float:
+        # planners keep per-dictionary state in matrix.memo; start every repetition cold
+        matrix.memo.clear()
+        total = 0
+        for secret in secrets:
+            total += algo_func(words, secret, matrix=matrix)[1]
+        return total / len(secrets)
+    return run
+
+def build_cases(words: List[str], matrix: FeedbackMatrix, sweep: bool) -> List[Tuple[str, Callable, int]]:
+    """(name, callable, minimum repetitions); search callables return their mean guess count."""
+    letter_freq = get_letter_frequencies(words)
+    pairs = [(words[i], words[(i * 7 + 3) % len(words)]) for i in range(0, len(words), 3)]
+    guess, secret = 'crane', sample_secrets(words, 1)[0]
+    feedback = get_feedback(secret, guess)
+    candidates = matrix.all_indices()
+    cases = [
+        ('get_feedback', lambda: [get_feedback(s, g) for s, g in pairs], 5),
+        ('filter_words', lambda: filter_words(words, guess, feedback), 5),
+        ('filter_words[matrix]', lambda: matrix.filter(candidates, guess, feedback), 20),
+        ('calculate_heuristic', lambda: [calculate_heuristic(w, letter_freq) for w in words], 5),
+    ]
+    secrets = sample_secrets(words, SAMPLE_SIZE)
+    for name in ALGORITHMS:
+        cases.append((f"search[{name}]", search_case(name, words, secrets, matrix), 1))
+    if sweep:
+        for name in SWEEP_ALGORITHMS:
+            cases.append((f"sweep[{name}]", search_case(name, words, words, matrix), 1))
+    return cases
+
+def measure(func: Callable, repetitions: int, min_time: float = MIN_TIME) -> Dict:
+    """Best of at least `repetitions` runs, repeated until min_time seconds have been spent."""
+    times = []
+    metric = None
+    while len(times) < repetitions or sum(times) < min_time:
+        start = time.perf_counter()
+        metric = func()
+        times.append(time.perf_counter() - start)
+    result = {'ms': min(times) * 1e3, 'runs': len(times)}
+    if isinstance(metric, float):
+        result['mean_guesses'] = round(metric, 4)
+    return result
+
+def run_suite(words: List[str], sweep: bool, only: Optional[List[str]] = None,
+              min_time: float = MIN_TIME) -> Dict[str, Dict]:
+    matrix = FeedbackMatrix.load(words)
+    results = {}
+    for name, func, repetitions in build_cases(words, matrix, sweep):
+        if only and not any(pattern in name for pattern in only):
+            continue
+        results[name] = measure(func, repetitions, min_time)
+        print(f"  {name:<36} {results[name]['ms']:10.2f} ms", file=sys.stderr)
+    return results
+
+def compare(baseline: Dict[str, Dict], current: Dict[str, Dict], threshold: float) -> List[str]:
+    """Print the comparison table and return the names of regressed cases."""
+    regressions = []
+    print(f"{'case':<36} {'baseline':>11} {'current':>11} {'change':>8}  status")
+    for name, result in current.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<36} {'-':>11} {result['ms']:>9.2f}ms {'-':>8}  new")
+            continue
+        change = (result['ms'] / before['ms'] - 1) * 100 if before['ms'] else 0.0
+        status = 'ok'
+        if change > threshold:
+            status = 'REGRESSED'
+            regressions.append(name)
+        elif change < -threshold:
+            status = 'faster'
+        if before.get('mean_guesses') != result.get('mean_guesses'):
+            status += f" (mean guesses {before.get('mean_guesses')} -> {result.get('mean_guesses')})"
+        print(f"{name:<36} {before['ms']:>9.2f}ms {result['ms']:>9.2f}ms {change:>+7.1f}%  {status}")
+    return regressions
+
+def machine_info() -> Dict:
+    return {'python': platform.python_version(), 'machine': platform.machine(), 'processor': platform.processor(),
+            'cpus': os.cpu_count()}
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Regression benchmarks for the word_utils hot paths and the searches")
+    parser.add_argument('--words', default='five_letter_words.txt')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument('--save', action='store_true', help="record this run as the new baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="fail when a case is more than this many percent slower than the baseline")
+    parser.add_argument('--sweep', action='store_true', help="also solve the full dictionary with the faster algorithms")
+    parser.add_argument('--min-time', type=float, default=MIN_TIME,
+                        help="seconds to keep repeating each case; longer runs are less noisy")
+    parser.add_argument('--only', action='append', metavar='TEXT', help="run only cases whose name contains TEXT")
+    parser.add_argument('--import-budget', type=float, metavar='MS', help="also fail if importing cli.py exceeds MS")
+    args = parser.parse_args(argv)
+
+    words = load_words(args.words)
+    current = run_suite(words, args.sweep, args.only, args.min_time)
+    failed = False
+    if args.import_budget is not None:
+        from cli import import_time_ms
+        elapsed = import_time_ms('cli')
+        print(f"import cli: {elapsed:.1f} ms (budget {args.import_budget:.0f} ms)")
+        failed = elapsed > args.import_budget
+
+    if args.save or not os.path.exists(args.baseline):
+        os.makedirs(os.path.dirname(args.baseline) or '.', exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump({'machine': machine_info(), 'words_hash': words_hash(words), 'results': current}, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 1 if failed else 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get('words_hash') != words_hash(words):
+        print("Warning: the baseline was recorded with a different word list", file=sys.stderr)
+    if baseline.get('machine') != machine_info():
+        print("Warning: the baseline was recorded on a different machine or Python", file=sys.stderr)
+    regressions = compare(baseline['results'], current, args.threshold)
+    if regressions:
+        print(f"{len(regressions)} case(s) regressed by more than {args.threshold:.0f}%: {', '.join(regressions)}")
+        failed = True
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,110 @@
+import argparse
+import random
+import time
+from queue import PriorityQueue
+from typing import List, Tuple
+from algorithms import best_first_search, astar_search
+from data_structures import PrioritizedItem
+from word_utils import (
+    load_words, get_feedback, get_letter_frequencies, filter_words,
+    calculate_heuristic, calculate_g_cost
+)
+
+def legacy_best_first_search(words: List[str], secret: str) -> Tuple[List[str], int]:
+    letter_freq = get_letter_frequencies(words)
+    pq = PriorityQueue()
+    possible_words = words.copy()
+    guesses = []
+    for word in possible_words:
+        pq.put((calculate_heuristic(word, letter_freq), word))
+    while not pq.empty() and len(guesses) < 6:
+        _, guess = pq.get()
+        guesses.append(guess)
+        feedback = get_feedback(secret, guess)
+        if feedback == 'ggggg':
+            return guesses, len(guesses)
+        possible_words = filter_words(possible_words, guess, feedback)
+        while not pq.empty():
+            pq.get()
+        for word in possible_words:
+            pq.put((calculate_heuristic(word, letter_freq), word))
+    return guesses, len(guesses)
+
+def legacy_astar_search(words: List[str], secret: str) -> Tuple[List[str], int]:
+    letter_freq = get_letter_frequencies(words)
+    pq = PriorityQueue()
+    possible_words = words.copy()
+    guesses = []
+    for word in possible_words:
+        h_cost = calculate_heuristic(word, letter_freq)
+        pq.put(PrioritizedItem(-h_cost, 0, word))
+    while not pq.empty() and len(guesses) < 6:
+        current = pq.get()
+        guesses.append(current.word)
+        feedback = get_feedback(secret, current.word)
+        if feedback == 'ggggg':
+            return guesses, len(guesses)
+        possible_words = filter_words(possible_words, current.word, feedback)
+        while not pq.empty():
+            pq.get()
+        g_cost = calculate_g_cost(guesses)
+        for word in possible_words:
+            pq.put(PrioritizedItem(g_cost - calculate_heuristic(word, letter_freq), g_cost, word))
+    return guesses, len(guesses)
+
+def live_astar_search(words: List[str], secret: str) -> Tuple[List[str], int]:
+    # the current A* policy (h against the live candidates' letter frequencies) on a
+    # PriorityQueue that recounts them every turn instead of keeping a FrequencyTracker in step
+    pq = PriorityQueue()
+    possible_words = words.copy()
+    guesses = []
+    while possible_words and len(guesses) < 6:
+        letter_freq = get_letter_frequencies(possible_words)
+        g_cost = calculate_g_cost(guesses)
+        for word in possible_words:
+            pq.put(PrioritizedItem((g_cost - calculate_heuristic(word, letter_freq), word), g_cost, word))
+        current = pq.get()
+        guesses.append(current.word)
+        feedback = get_feedback(secret, current.word)
+        if feedback == 'ggggg':
+            return guesses, len(guesses)
+        possible_words = filter_words(possible_words, current.word, feedback)
+        while not pq.empty():
+            pq.get()
+    return guesses, len(guesses)
+
+# (name, baseline, current, note)
+PAIRS = [
+    ("Best First Search", legacy_best_first_search, best_first_search, ""),
+    ("A* Search (original)", legacy_astar_search, astar_search,
+     "original A* scores against dictionary-wide frequencies, current A* against the live candidates'"),
+    ("A* Search (live PQ)", live_astar_search, astar_search,
+     "same policy as current A*, PriorityQueue rebuilt each turn"),
+]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the PriorityQueue searches with the ranked and incremental ones")
+    parser.add_argument('--samples', type=int, default=100, help="secrets to time; 0 for the full dictionary")
+    args = parser.parse_args(argv)
+    words = load_words()
+    secrets = words if args.samples == 0 else random.Random(0).sample(words, args.samples)
+    print(f"{'Algorithm':<22} {'baseline ms':>11} {'current ms':>10} {'speedup':>8} {'same guesses':>13}")
+    for name, baseline, current, note in PAIRS:
+        baseline_time = current_time = 0.0
+        same = 0
+        for secret in secrets:
+            start = time.perf_counter()
+            old = baseline(words, secret)
+            middle = time.perf_counter()
+            new = current(words, secret)
+            baseline_time += middle - start
+            current_time += time.perf_counter() - middle
+            same += old == new
+        print(f"{name:<22} {baseline_time / len(secrets) * 1e3:>11.2f}"
+              f" {current_time / len(secrets) * 1e3:>10.2f}"
+              f" {baseline_time / current_time:>7.1f}x {same:>6}/{len(secrets)}")
+        if note:
+            print(f"{'':<22} {note}")
+
+if __name__ == '__main__':
+    main()
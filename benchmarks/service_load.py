@@ -0,0 +1,121 @@
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from typing import List, Optional, Tuple
+from service import DEFAULT_HOST, DEFAULT_PORT
+from timing import percentile
+from word_utils import get_feedback, load_words
+
+OPENER = 'tares'
+
+async def request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str,
+                  body: Optional[dict] = None) -> Tuple[int, dict]:
+    data = json.dumps(body).encode() if body is not None else b''
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(data)}\r\n\r\n".encode() + data)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        header = await reader.readline()
+        if header in (b'\r\n', b''):
+            break
+        name, _, value = header.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+def make_body(endpoint: str, words: List[str], rng: random.Random, algorithm: str) -> dict:
+    secret = rng.choice(words)
+    if endpoint == 'solve':
+        return {'algorithm': algorithm, 'secret': secret}
+    # suggest after zero to two guesses, so many requests share their state
+    history = []
+    for guess in [OPENER, rng.choice(words)][:rng.randrange(3)]:
+        history.append([guess, get_feedback(secret, guess)])
+    return {'algorithm': algorithm, 'history': history}
+
+async def client(host: str, port: int, jobs: asyncio.Queue, latencies: List[float], errors: List[str]):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            try:
+                endpoint, body = jobs.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            start = time.perf_counter()
+            status, payload = await request(reader, writer, 'POST', f'/{endpoint}', body)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(payload.get('error', str(status)))
+    finally:
+        writer.close()
+
+async def run(args, words: List[str]):
+    rng = random.Random(args.seed)
+    jobs: asyncio.Queue = asyncio.Queue()
+    for _ in range(args.requests):
+        endpoint = 'solve' if rng.random() < args.solve_fraction else 'suggest'
+        jobs.put_nowait((endpoint, make_body(endpoint, words, rng, args.algorithm)))
+    latencies: List[float] = []
+    errors: List[str] = []
+    start = time.perf_counter()
+    await asyncio.gather(*[client(args.host, args.port, jobs, latencies, errors) for _ in range(args.concurrency)])
+    wall = time.perf_counter() - start
+    reader, writer = await asyncio.open_connection(args.host, args.port)
+    _, stats = await request(reader, writer, 'GET', '/stats')
+    writer.close()
+
+    ms = [latency * 1e3 for latency in latencies]
+    print(f"{len(latencies)} requests, {args.concurrency} connections, {args.solve_fraction:.0%} solve, {args.algorithm}")
+    print(f"Throughput: {len(latencies) / wall:.1f} req/s over {wall:.2f} s, errors: {len(errors)}")
+    print(f"Latency ms: mean {sum(ms) / len(ms):.2f}, p50 {percentile(ms, 50):.2f}, p99 {percentile(ms, 99):.2f}, "
+          f"max {max(ms):.2f}")
+    print(f"Server: {stats}")
+    if errors:
+        print(f"First error: {errors[0]}")
+
+async def wait_for_server(host: str, port: int, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.2)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load generator for service.py: throughput and p99 latency")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--solve-fraction', type=float, default=0.1, help="share of /solve among the requests")
+    parser.add_argument('--algorithm', default='Entropy Search')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--start-server', action='store_true', help="run service.py as a subprocess for the test")
+    parser.add_argument('--server-args', default='', help="extra options for the started server")
+    args = parser.parse_args(argv)
+    words = load_words()
+    server = None
+    if args.start_server:
+        server = subprocess.Popen([sys.executable, 'service.py', '--host', args.host, '--port', str(args.port),
+                                   *args.server_args.split()])
+    try:
+        if server is not None:
+            asyncio.run(wait_for_server(args.host, args.port))
+        asyncio.run(run(args, words))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+import random
+import sys
+import timeit
+import tracemalloc
+from word_store import WordStore
+from word_utils import load_words, get_letter_frequencies
+
+def list_footprint(words) -> int:
+    return sys.getsizeof(words) + sum(sys.getsizeof(word) for word in words)
+
+def main():
+    tracemalloc.start()
+    words = load_words()
+    list_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    store = WordStore.open()
+    assert store.word_list() == words
+    assert store.letter_frequencies() == get_letter_frequencies(words)
+    probes = random.Random(0).sample(words, 200) + ['zzzzz', 'qwert']
+    number = 20
+    list_lookup = min(timeit.repeat(lambda: [p in words for p in probes], number=number, repeat=3))
+    store_lookup = min(timeit.repeat(lambda: [p in store for p in probes], number=number, repeat=3))
+    open_time = min(timeit.repeat(WordStore.open, number=20, repeat=3)) / 20
+    print(f"words: {len(store)}")
+    print(f"list of str: {list_footprint(words)} bytes (getsizeof), {list_bytes} bytes traced while loading")
+    print(f"word store:  {store.nbytes} bytes mapped")
+    print(f"membership:  list {list_lookup / number / len(probes) * 1e6:.2f} us, "
+          f"store {store_lookup / number / len(probes) * 1e6:.2f} us")
+    print(f"open store:  {open_time * 1e3:.3f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+from collections import Counter
+from typing import Dict, Iterable, List
+import numpy as np
+from word_utils import WORD_LENGTH
+
+SMALL_SET = 64
+
+class BitsetFilter:
+    """Constraint engine over a fixed dictionary where every word set is an int bitset."""
+
+    def __init__(self, words: List[str]):
+        self.words = words
+        self.index = {word: i for i, word in enumerate(words)}
+        self.full = (1 << len(words)) - 1
+        self.position_masks: List[Dict[str, int]] = [{} for _ in range(WORD_LENGTH)]
+        self.count_masks: Dict[str, List[int]] = {}
+        for i, word in enumerate(words):
+            bit = 1 << i
+            for pos, letter in enumerate(word):
+                self.position_masks[pos][letter] = self.position_masks[pos].get(letter, 0) | bit
+            for letter, count in Counter(word).items():
+                masks = self.count_masks.setdefault(letter, [0] * (WORD_LENGTH + 2))
+                for k in range(1, count + 1):
+                    masks[k] |= bit
+        for masks in self.count_masks.values():
+            masks[0] = self.full
+
+    def at_least(self, letter: str, count: int) -> int:
+        if count == 0:
+            return self.full
+        masks = self.count_masks.get(letter)
+        return masks[count] if masks and count <= WORD_LENGTH else 0
+
+    def exactly(self, letter: str, count: int) -> int:
+        return self.at_least(letter, count) & ~self.at_least(letter, count + 1)
+
+    def constraint_mask(self, guess: str, feedback: str) -> int:
+        mask = self.full
+        found: Dict[str, int] = {}
+        rejected = set()
+        for pos, (letter, mark) in enumerate(zip(guess, feedback)):
+            at_pos = self.position_masks[pos].get(letter, 0)
+            if mark == 'g':
+                mask &= at_pos
+                found[letter] = found.get(letter, 0) + 1
+                continue
+            mask &= ~at_pos
+            if mark == 'y':
+                if letter in rejected:
+                    return 0
+                found[letter] = found.get(letter, 0) + 1
+            else:
+                rejected.add(letter)
+        for letter, count in found.items():
+            mask &= self.exactly(letter, count) if letter in rejected else self.at_least(letter, count)
+        for letter in rejected.difference(found):
+            mask &= self.exactly(letter, 0)
+        return mask
+
+    def to_bitset(self, words: Iterable[str]) -> int:
+        bits = 0
+        for word in words:
+            bits |= 1 << self.index[word]
+        return bits
+
+    def from_bitset(self, bits: int) -> List[str]:
+        return [self.words[i] for i in self.bitset_indices(bits)]
+
+    def bitset_array(self, bits: int) -> np.ndarray:
+        """One 0/1 entry per dictionary word."""
+        raw = np.frombuffer(bits.to_bytes((len(self.words) + 7) // 8, 'little'), dtype=np.uint8)
+        return np.unpackbits(raw, count=len(self.words), bitorder='little')
+
+    def bitset_indices(self, bits: int) -> np.ndarray:
+        return np.flatnonzero(self.bitset_array(bits))
+
+    def filter_bits(self, bits: int, guess: str, feedback: str) -> int:
+        return bits & self.constraint_mask(guess, feedback)
+
+    def filter_words(self, words: List[str], guess: str, feedback: str) -> List[str]:
+        mask = self.constraint_mask(guess, feedback)
+        if len(words) <= SMALL_SET:
+            return [word for word in words if mask >> self.index[word] & 1]
+        if words is self.words or words == self.words:
+            return self.from_bitset(mask)
+        # look the input up in the mask rather than rebuilding from set bits, so input order is kept
+        positions = np.fromiter((self.index[word] for word in words), dtype=np.intp, count=len(words))
+        return [words[i] for i in np.flatnonzero(self.bitset_array(mask)[positions])]
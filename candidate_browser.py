@@ -0,0 +1,186 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from feedback_matrix import FeedbackMatrix
+from scoring import heuristic_scores, letter_counts
+
+SORT_KEYS = ('Alphabetical', 'Score')
+ROW_HEIGHT = 18
+FONT = ("Courier", 10)
+
+def word_array(matrix: FeedbackMatrix) -> np.ndarray:
+    if 'word_array' not in matrix.memo:
+        matrix.memo['word_array'] = np.array(matrix.words)
+    return matrix.memo['word_array']
+
+class CandidateView:
+    """Candidates left after each turn of one game, and the sorted, prefix-filtered rows shown from them.
+
+    Each turn's index array is filtered from the previous one, and its heuristic scores
+    (calculate_heuristic against the letter counts of that turn's candidates) are computed
+    once per turn on first use, so re-sorting or re-filtering is only a mask and an argsort.
+    """
+
+    def __init__(self, matrix: FeedbackMatrix):
+        self.matrix = matrix
+        self.words = word_array(matrix)
+        self.turns: List[np.ndarray] = []
+        self.labels: List[str] = []
+        self._scores: Dict[int, np.ndarray] = {}
+        self.turn = 0
+        self.sort_key = SORT_KEYS[0]
+        self.prefix = ''
+        self.rows = np.empty(0, dtype=np.intp)
+        self.row_scores = np.empty(0)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def reset(self):
+        self.turns, self.labels = [self.matrix.all_indices()], []
+        self._scores.clear()
+        self.labels.append(f"Start ({len(self.turns[0])})")
+        self.turn = 0
+        self._refresh()
+
+    def add_turn(self, guess: str, feedback: int):
+        candidates = self.matrix.filter(self.turns[-1], guess, feedback)
+        self.turns.append(candidates)
+        self.labels.append(f"After {guess.upper()} ({len(candidates)})")
+
+    def set_game(self, guesses: List[str], secret: str):
+        self.reset()
+        for guess in guesses:
+            self.add_turn(guess, self.matrix.feedback(guess, secret))
+
+    def clear(self):
+        self.turns, self.labels = [], []
+        self._scores.clear()
+        self._refresh()
+
+    def scores(self, turn: int) -> np.ndarray:
+        if turn not in self._scores:
+            candidates = self.turns[turn]
+            self._scores[turn] = heuristic_scores(self.matrix, candidates, letter_counts(self.matrix, candidates)[0])
+        return self._scores[turn]
+
+    def select(self, turn: Optional[int] = None, sort_key: Optional[str] = None, prefix: Optional[str] = None):
+        if turn is not None:
+            self.turn = turn
+        if sort_key is not None:
+            self.sort_key = sort_key
+        if prefix is not None:
+            self.prefix = prefix.strip().lower()
+        self._refresh()
+
+    def _refresh(self):
+        if not self.turns:
+            self.rows, self.row_scores = np.empty(0, dtype=np.intp), np.empty(0)
+            return
+        rows, scores = self.turns[self.turn], self.scores(self.turn)
+        if self.prefix:
+            mask = np.char.startswith(self.words[rows], self.prefix)
+            rows, scores = rows[mask], scores[mask]
+        if self.sort_key == 'Score':
+            order = np.argsort(-scores, kind='stable')
+            rows, scores = rows[order], scores[order]
+        self.rows, self.row_scores = rows, scores
+
+    def window(self, start: int, count: int) -> List[Tuple[int, str, float]]:
+        """(rank, word, score) of the rows in [start, start + count)."""
+        rows = self.rows[start:start + count]
+        return [(start + i + 1, self.matrix.words[row], float(score))
+                for i, (row, score) in enumerate(zip(rows, self.row_scores[start:start + count]))]
+
+class CandidateBrowser:
+    """Turn selector, sort and prefix controls over a canvas that draws only the visible rows.
+
+    The canvas keeps one text item per visible line and rewrites their text on every
+    scroll, so a 3000-word turn costs the same to show and scroll as a 20-word one.
+    """
+
+    def __init__(self, parent, matrix: FeedbackMatrix, theme: Dict[str, str]):
+        self.view = CandidateView(matrix)
+        self.first = 0
+        self._items: List[int] = []
+
+        self.frame = ttk.LabelFrame(parent, text="Candidates", style="TLabelframe", padding=5)
+        controls = ttk.Frame(self.frame, style="TFrame")
+        controls.pack(fill='x', pady=(0, 5))
+        self.turn_box = ttk.Combobox(controls, state='readonly', width=22)
+        self.turn_box.pack(side='left')
+        self.turn_box.bind('<<ComboboxSelected>>', lambda event: self._select(turn=self.turn_box.current()))
+        self.sort_box = ttk.Combobox(controls, values=SORT_KEYS, state='readonly', width=12)
+        self.sort_box.current(0)
+        self.sort_box.pack(side='left', padx=5)
+        self.sort_box.bind('<<ComboboxSelected>>', lambda event: self._select(sort_key=self.sort_box.get()))
+        self.prefix_var = tk.StringVar()
+        self.prefix_var.trace_add('write', lambda *args: self._select(prefix=self.prefix_var.get()))
+        ttk.Entry(controls, textvariable=self.prefix_var, style="TEntry", width=8).pack(side='left')
+        self.count_label = ttk.Label(controls, text="", style="TLabel")
+        self.count_label.pack(side='left', padx=5)
+
+        body = ttk.Frame(self.frame, style="TFrame")
+        body.pack(fill='both', expand=True)
+        self.canvas = tk.Canvas(body, bg=theme['axes'], highlightthickness=0, width=230)
+        self.scrollbar = ttk.Scrollbar(body, orient='vertical', command=self._on_scroll, style="Vertical.TScrollbar")
+        self.scrollbar.pack(side='right', fill='y')
+        self.canvas.pack(side='left', fill='both', expand=True)
+        self.text_color = theme['text']
+        self.canvas.bind('<Configure>', lambda event: self._render())
+        self.canvas.bind('<MouseWheel>', lambda event: self._scroll_by(-1 if event.delta > 0 else 1, 3))
+        self.canvas.bind('<Button-4>', lambda event: self._scroll_by(-1, 3))
+        self.canvas.bind('<Button-5>', lambda event: self._scroll_by(1, 3))
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def set_game(self, guesses: List[str], secret: str):
+        self.view.set_game(guesses, secret)
+        self.turn_box.configure(values=self.view.labels)
+        self.turn_box.current(0)
+        self._select(turn=0)
+
+    def clear(self):
+        self.view.clear()
+        self.turn_box.configure(values=[])
+        self.turn_box.set('')
+        self._select()
+
+    def _select(self, **kwargs):
+        self.view.select(**kwargs)
+        self.first = 0
+        self._render()
+
+    def _visible_rows(self) -> int:
+        return max(1, self.canvas.winfo_height() // ROW_HEIGHT)
+
+    def _scroll_by(self, direction: int, lines: int):
+        self.first += direction * lines
+        self._render()
+
+    def _on_scroll(self, action: str, amount: str, unit: str = 'units'):
+        if action == 'moveto':
+            self.first = int(float(amount) * len(self.view))
+        else:
+            self._scroll_by(int(amount), self._visible_rows() if unit == 'pages' else 1)
+            return
+        self._render()
+
+    def _render(self):
+        count = self._visible_rows()
+        total = len(self.view)
+        self.first = max(0, min(self.first, total - count))
+        rows = self.view.window(self.first, count)
+        while len(self._items) < count:
+            self._items.append(self.canvas.create_text(4, len(self._items) * ROW_HEIGHT + 2, anchor='nw',
+                                                       font=FONT, fill=self.text_color))
+        for i, item in enumerate(self._items):
+            if i < len(rows):
+                rank, word, score = rows[i]
+                self.canvas.itemconfigure(item, text=f"{rank:>5}  {word.upper()}  {score:>8.0f}", state='normal')
+            else:
+                self.canvas.itemconfigure(item, state='hidden')
+        self.scrollbar.set(*((self.first / total, (self.first + len(rows)) / total) if total else (0, 1)))
+        self.count_label.config(text=f"{total} shown" if self.view.turns else "")
@@ -0,0 +1,186 @@
+import argparse
+import functools
+import os
+import subprocess
+import sys
+import time
+from typing import List, Optional
+from algorithms import ALGORITHMS
+from assist import AssistSession, DEFAULT_ALGORITHM
+from feedback_matrix import FeedbackMatrix, decode_feedback
+from instrumentation import Instrumentation
+from timing import DEFAULT_REPEATS, DEFAULT_WARMUP, format_summary, measure, summarize_times
+from word_utils import load_words, WORD_LENGTH
+
+HEAVY_MODULES = ('tkinter', 'matplotlib')
+IMPORT_BUDGET_MS = 400.0
+
+class ImportBudgetError(Exception):
+    pass
+
+def load_matrix(args, words: List[str]) -> FeedbackMatrix:
+    return FeedbackMatrix.load(words, guesses=load_words(args.guesses) if args.guesses else None)
+
+def cmd_solve(args) -> int:
+    words = load_words(args.words)
+    secret = args.secret.strip().lower()
+    if len(secret) != WORD_LENGTH or secret not in set(words):
+        print(f"{secret!r} is not in {args.words}", file=sys.stderr)
+        return 2
+    matrix = load_matrix(args, words)
+    instrumentation = None
+    if args.trace or args.profile or args.allocations:
+        instrumentation = Instrumentation(track_allocations=args.allocations, profile_dir=args.profile)
+        instrumentation.enable()
+    try:
+        for name in args.algorithm or list(ALGORITHMS):
+            solve = functools.partial(ALGORITHMS[name], words, secret, matrix=matrix, hard_mode=args.hard_mode)
+            if args.timing:
+                (guesses, count), samples = measure(solve, args.warmup, args.repeats, args.no_gc)
+                summary = summarize_times([sample / 1e9 for sample in samples])
+                elapsed = summary['median']
+            else:
+                start = time.perf_counter_ns()
+                guesses, count = solve()
+                elapsed = (time.perf_counter_ns() - start) / 1e9
+            path = ' '.join(f"{guess}:{decode_feedback(matrix.feedback(guess, secret))}" for guess in guesses)
+            print(f"{name:<24} {count} guesses {elapsed * 1e3:8.2f} ms  {path}")
+            if args.timing:
+                print(f"{'':<24} {format_summary(summary)}")
+    finally:
+        if instrumentation is not None:
+            instrumentation.disable()
+    if instrumentation is not None:
+        if args.trace:
+            instrumentation.write_json(args.trace)
+        for name, counter in instrumentation.calls.items():
+            print(f"{name:<32} {counter['calls']:>9} calls {counter['total_ns'] / 1e6:10.2f} ms")
+    return 0
+
+def import_time_ms(module: str) -> float:
+    """Cumulative import time of module in a fresh interpreter; ImportBudgetError if it pulls in a GUI module."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        raise ImportBudgetError(f"importing {module} failed: {result.stderr.strip().splitlines()[-1]}")
+    total = 0
+    for line in result.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].rstrip() == f' {module}':
+            total = int(parts[1])
+        elif len(parts) == 3 and parts[2].strip().split('.')[0] in HEAVY_MODULES:
+            raise ImportBudgetError(f"importing {module} pulled in {parts[2].strip()}")
+    return total / 1e3
+
+def cmd_bench(args) -> int:
+    if args.import_budget is not None:
+        try:
+            elapsed = import_time_ms('cli')
+        except ImportBudgetError as e:
+            print(f"import cli: {e}", file=sys.stderr)
+            return 1
+        print(f"import cli: {elapsed:.1f} ms (budget {args.import_budget:.0f} ms)")
+        return 0 if elapsed <= args.import_budget else 1
+    import batch_eval
+    batch_eval.main(args.batch_args)
+    return 0
+
+def cmd_assist(args) -> int:
+    words = load_words(args.words)
+    session = AssistSession(words, load_matrix(args, words), args.algorithm)
+    print("Enter '<guess> <colors>' with colors g/y/b (e.g. 'tares bygbb'), 'undo', 'redo', 'reset' or 'quit'.")
+    while True:
+        candidates = session.candidate_words
+        if not candidates:
+            print("No dictionary word matches that feedback; try 'undo'")
+        elif len(candidates) == 1:
+            print(f"Answer: {candidates[0]}")
+        else:
+            shown = f": {' '.join(candidates)}" if len(candidates) <= 10 else ''
+            print(f"{len(candidates)} candidates{shown}, suggested guess: {session.suggest()}")
+        try:
+            line = input('> ').strip().lower()
+        except EOFError:
+            return 0
+        if line in ('q', 'quit', 'exit'):
+            return 0
+        if line in ('undo', 'redo'):
+            if not getattr(session, line)():
+                print(f"Nothing to {line}")
+            continue
+        if line == 'reset':
+            session.reset()
+            continue
+        parts = line.split()
+        try:
+            if len(parts) != 2:
+                raise ValueError("Expected a guess and five color letters")
+            session.apply(*parts)
+        except ValueError as e:
+            print(e)
+
+def cmd_serve(args) -> int:
+    import service
+    options = ['--words', args.words, '--host', args.host, '--port', str(args.port)]
+    if args.guesses:
+        options += ['--guesses', args.guesses]
+    if args.processes:
+        options += ['--processes', str(args.processes)]
+    service.main(options)
+    return 0
+
+def cmd_gui(args) -> int:
+    from main import main as run_gui
+    run_gui()
+    return 0
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Headless Wordle solver")
+    parser.add_argument('--words', default='five_letter_words.txt', help="dictionary file")
+    parser.add_argument('--guesses', help="allowed-guess list, if larger than the answer list")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    solve = commands.add_parser('solve', help="solve a secret word with each algorithm")
+    solve.add_argument('secret')
+    solve.add_argument('--algorithm', action='append', choices=list(ALGORITHMS), help="repeatable; defaults to all")
+    solve.add_argument('--hard-mode', action='store_true', help="every guess must reuse all revealed hints")
+    solve.add_argument('--timing', action='store_true',
+                       help="time warmed-up repeated solves and print min/median/mean/stdev and a 95%% CI")
+    solve.add_argument('--warmup', type=int, default=DEFAULT_WARMUP, help="untimed solves before timing")
+    solve.add_argument('--repeats', type=int, default=DEFAULT_REPEATS, help="timed solves per algorithm")
+    solve.add_argument('--no-gc', action='store_true', help="disable the garbage collector during timed solves")
+    solve.add_argument('--trace', metavar='FILE', help="write call counts and per-turn timings as JSON")
+    solve.add_argument('--profile', metavar='DIR', help="dump a cProfile .pstats file per algorithm run")
+    solve.add_argument('--allocations', action='store_true', help="record traced allocations per run")
+    solve.set_defaults(func=cmd_solve)
+
+    bench = commands.add_parser('bench', help="batch evaluation (options are passed to batch_eval.py)")
+    bench.add_argument('--import-budget', type=float, metavar='MS', nargs='?', const=IMPORT_BUDGET_MS,
+                       help="only check that importing the CLI stays under MS milliseconds (default %(const).0f) "
+                            "without GUI modules")
+    bench.set_defaults(func=cmd_bench)
+
+    assist = commands.add_parser('assist', help="suggest guesses for a live game")
+    assist.add_argument('--algorithm', choices=list(ALGORITHMS), default=DEFAULT_ALGORITHM)
+    assist.set_defaults(func=cmd_assist)
+
+    serve = commands.add_parser('serve', help="run the local JSON service (see service.py)")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8765)
+    serve.add_argument('--processes', type=int, help="worker processes (default: CPU count)")
+    serve.set_defaults(func=cmd_serve)
+
+    gui = commands.add_parser('gui', help="launch the Tk interface")
+    gui.set_defaults(func=cmd_gui)
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if extra and args.command != 'bench':
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    args.batch_args = extra
+    return args.func(args)
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,193 @@
+from tkinter import ttk
+from typing import Dict, List, Optional
+import numpy as np
+from matplotlib.collections import LineCollection # type: ignore
+from matplotlib.figure import Figure # type: ignore
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg # type: ignore
+from timing import summarize_times
+
+DARK_THEME = {'figure': '#121212', 'axes': '#1E1E1E', 'spine': '#2D2D2D', 'title': '#00FFB3',
+              'label': '#00BFFF', 'text': '#FFFFFF'}
+LIGHT_THEME = {'figure': '#F5F5F5', 'axes': '#FFFFFF', 'spine': '#CCCCCC', 'title': '#2C3E50',
+               'label': '#34495E', 'text': '#2C3E50'}
+COLORS = ['#00FFB3', '#FF1493', '#00BFFF', '#FFD700', '#FF8C00', '#9370DB']
+GUESS_BINS = 8  # the last bin collects every run of 8 or more guesses
+LATENCY_BINS = np.logspace(-4, 2, 25)  # 0.1 ms to 100 s
+HEADROOM = 1.25
+
+# algorithm -> {'time': [seconds per secret], 'guesses': [guess count per secret]}, plus
+# 'samples': [seconds of every timed repetition] when the solves were measured repeatedly
+Results = Dict[str, Dict[str, List[float]]]
+
+def time_summary(run: Dict[str, List[float]]) -> Optional[Dict[str, float]]:
+    samples = run.get('samples', [])
+    return summarize_times(samples) if len(samples) > 1 else None
+
+class ComparisonChart:
+    """Time and guess bars plus guess-count and latency distributions on one long-lived Figure.
+
+    Every data artist is created once and marked animated. An update sets bar heights and
+    line data, restores the cached background and blits just those artists; the figure is
+    drawn in full only when a bar outgrows its y-limit (or the canvas is resized). The
+    distributions are shares of runs, so their axes never need rescaling.
+    """
+
+    def __init__(self, figure: Figure, canvas, names: List[str], theme: Dict[str, str] = DARK_THEME):
+        self.figure = figure
+        self.canvas = canvas
+        self.names = names
+        self.theme = theme
+        self.time_ax, self.guess_ax, self.dist_ax, self.latency_ax = figure.subplots(2, 2).ravel()
+        x = np.arange(len(names))
+        colors = [COLORS[i % len(COLORS)] for i in range(len(names))]
+        self.time_bars = self.time_ax.bar(x, np.zeros(len(names)), color=colors, animated=True)
+        self.guess_bars = self.guess_ax.bar(x, np.zeros(len(names)), color=colors, animated=True)
+        self.time_labels = [self.time_ax.text(i, 0, '', ha='center', va='bottom', color=theme['text'],
+                                              fontsize=8, animated=True) for i in x]
+        self.time_ci = self.time_ax.add_collection(LineCollection([], colors=theme['text'], linewidths=1.5,
+                                                                  animated=True))
+        self.guess_labels = [self.guess_ax.text(i, 0, '', ha='center', va='bottom', color=theme['text'],
+                                                fontsize=8, animated=True) for i in x]
+        width = 0.8 / len(names)
+        self.dist_bars = [self.dist_ax.bar(np.arange(1, GUESS_BINS + 1) + (i - (len(names) - 1) / 2) * width,
+                                           np.zeros(GUESS_BINS), width, color=colors[i], animated=True)
+                          for i in range(len(names))]
+        self.latency_lines = [self.latency_ax.step(LATENCY_BINS, np.zeros(len(LATENCY_BINS)), where='post',
+                                                   color=colors[i], label=name, animated=True)[0]
+                              for i, name in enumerate(names)]
+        self._style(x)
+        self._background = None
+        canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _style(self, x: np.ndarray):
+        theme = self.theme
+        titles = ["Time Taken (seconds)", "Number of Guesses", "Guess Distribution (% of runs)",
+                  "Latency Distribution (% of runs)"]
+        for ax, title in zip((self.time_ax, self.guess_ax, self.dist_ax, self.latency_ax), titles):
+            ax.set_facecolor(theme['axes'])
+            ax.grid(True, linestyle='--', alpha=0.2)
+            ax.spines['top'].set_visible(False)
+            ax.spines['right'].set_visible(False)
+            ax.spines['bottom'].set_color(theme['spine'])
+            ax.spines['left'].set_color(theme['spine'])
+            ax.tick_params(axis='both', colors=theme['label'], labelsize=8)
+            ax.set_title(title, color=theme['title'], fontsize=10)
+        for ax in (self.time_ax, self.guess_ax):
+            ax.set_xticks(x)
+            ax.set_xticklabels(self.names, rotation=15, ha='right')
+            ax.set_ylim(0, 1)
+        self.dist_ax.set_xticks(np.arange(1, GUESS_BINS + 1))
+        self.dist_ax.set_xticklabels([str(i) for i in range(1, GUESS_BINS)] + [f"{GUESS_BINS}+"])
+        self.dist_ax.set_ylim(0, 100)
+        self.latency_ax.set_xscale('log')
+        self.latency_ax.set_xlim(LATENCY_BINS[0], LATENCY_BINS[-1])
+        self.latency_ax.set_ylim(0, 100)
+        self.latency_ax.set_xlabel("seconds per solve", color=theme['label'], fontsize=8)
+        self.latency_ax.legend(loc='upper right', fontsize=6, facecolor=theme['axes'], labelcolor=theme['text'],
+                               edgecolor=theme['spine'])
+        self.figure.set_layout_engine('tight')
+
+    @property
+    def animated(self) -> list:
+        artists = [*self.time_bars, self.time_ci, *self.guess_bars, *self.time_labels, *self.guess_labels,
+                   *self.latency_lines]
+        for bars in self.dist_bars:
+            artists.extend(bars)
+        return artists
+
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        for artist in self.animated:
+            self.figure.draw_artist(artist)
+
+    @staticmethod
+    def _set_bars(ax, bars, labels, values: List[float], fmt: str, tops: Optional[List[float]] = None) -> bool:
+        """Set bar heights and labels (placed at tops, e.g. above error bars); True if the y-limit had to grow."""
+        tops = tops or values
+        for bar, label, value, top in zip(bars, labels, values, tops):
+            bar.set_height(value)
+            label.set_y(top)
+            label.set_text(fmt.format(value) if value else '')
+        top = max(tops, default=0)
+        if top > ax.get_ylim()[1]:
+            ax.set_ylim(0, top * HEADROOM)
+            return True
+        return False
+
+    def update(self, results: Results):
+        runs = [results.get(name, {'time': [], 'guesses': []}) for name in self.names]
+        summaries = [time_summary(run) for run in runs]
+        times = [summary['mean'] if summary else float(np.mean(run['time'])) if run['time'] else 0.0
+                 for run, summary in zip(runs, summaries)]
+        guesses = [float(np.mean(run['guesses'])) if run['guesses'] else 0.0 for run in runs]
+        # 95% confidence interval of the mean time when the solves were repeated
+        self.time_ci.set_segments([[(i, summary['ci_low']), (i, summary['ci_high'])]
+                                   for i, summary in enumerate(summaries) if summary])
+        tops = [summary['ci_high'] if summary else time for time, summary in zip(times, summaries)]
+        rescaled = self._set_bars(self.time_ax, self.time_bars, self.time_labels, times, '{:.3f}s', tops)
+        rescaled |= self._set_bars(self.guess_ax, self.guess_bars, self.guess_labels, guesses, '{:.2f}')
+        for bars, line, run in zip(self.dist_bars, self.latency_lines, runs):
+            counts = np.bincount(np.minimum(np.asarray(run['guesses'], dtype=int), GUESS_BINS),
+                                 minlength=GUESS_BINS + 1)[1:]
+            for bar, share in zip(bars, counts * 100 / max(len(run['guesses']), 1)):
+                bar.set_height(share)
+            timed = run.get('samples') or run['time']
+            latency, _ = np.histogram(np.clip(timed, LATENCY_BINS[0], LATENCY_BINS[-1]), LATENCY_BINS)
+            line.set_ydata(np.append(latency, 0) * 100 / max(len(timed), 1))
+        if rescaled or self._background is None:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self._background)
+        for artist in self.animated:
+            self.figure.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)
+
+    def reset_scale(self):
+        for ax in (self.time_ax, self.guess_ax):
+            ax.set_ylim(0, 1)
+        self.update({})
+        self.canvas.draw()
+
+class ComparisonDashboard:
+    """Results table and comparison chart embedded in a GUI tab, updated in place on every run."""
+
+    def __init__(self, parent, names: List[str], theme: Dict[str, str] = DARK_THEME):
+        container = ttk.Frame(parent, style="TFrame")
+        container.pack(fill='both', expand=True)
+
+        table_frame = ttk.LabelFrame(container, text="Detailed Results", style="TLabelframe", padding=10)
+        table_frame.pack(side='left', fill='y', padx=(0, 10))
+        self.table = ttk.Treeview(table_frame, columns=('Algorithm', 'Runs', 'Time', 'Guesses'),
+                                  show='headings', style="Treeview", height=8)
+        for column, text, width in (('Algorithm', 'Algorithm', 170), ('Runs', 'Runs', 50),
+                                    ('Time', 'Mean time (s)', 130), ('Guesses', 'Mean guesses', 100)):
+            self.table.heading(column, text=text)
+            self.table.column(column, width=width, anchor='center')
+        self.table.pack(fill='both', expand=True)
+
+        graph_frame = ttk.LabelFrame(container, text="Visual Analysis", style="TLabelframe", padding=10)
+        graph_frame.pack(side='right', fill='both', expand=True)
+        # a bare Figure rather than pyplot: nothing global keeps it alive once the tab is gone
+        self.figure = Figure(figsize=(8, 6), facecolor=theme['figure'])
+        self.canvas = FigureCanvasTkAgg(self.figure, master=graph_frame)
+        self.chart = ComparisonChart(self.figure, self.canvas, names, theme)
+        widget = self.canvas.get_tk_widget()
+        widget.configure(bg=theme['figure'], highlightthickness=0)
+        widget.pack(fill='both', expand=True)
+
+    def update(self, results: Results):
+        self.table.delete(*self.table.get_children())
+        for name, run in results.items():
+            summary = time_summary(run)
+            time = (f"{summary['mean']:.4f} ±{summary['ci_high'] - summary['mean']:.4f}" if summary
+                    else f"{np.mean(run['time']):.3f}")
+            self.table.insert('', 'end', values=(name, len(run['time']), time, f"{np.mean(run['guesses']):.2f}"))
+        self.chart.update(results)
+
+    def clear(self):
+        self.table.delete(*self.table.get_children())
+        self.chart.reset_scale()
+
+    def close(self):
+        self.canvas.get_tk_widget().destroy()
+        self.figure.clear()
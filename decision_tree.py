@@ -0,0 +1,171 @@
+import argparse
+import json
+import os
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from algorithms import ALGORITHMS
+from feedback_matrix import FeedbackMatrix, CACHE_DIR, SOLVED_CODE, dictionary_key, encode_feedback, guess_list
+from word_utils import load_words, words_hash
+
+TREE_VERSION = 2
+
+class DecisionTree:
+    """Complete strategy tree flattened into arrays: node -> guess, (node, pattern) -> child.
+
+    words is the guess list the node guesses index into (the answers come first).
+    """
+
+    def __init__(self, words: List[str], strategy: str, guess: np.ndarray, edge_start: np.ndarray,
+                 edge_code: np.ndarray, edge_child: np.ndarray, stats: Dict):
+        self.words = words
+        self.strategy = strategy
+        self.guess = guess
+        self.edge_start = edge_start
+        self.edge_code = edge_code
+        self.edge_child = edge_child
+        self.stats = stats
+
+    @classmethod
+    def build(cls, words: List[str], strategy: str, matrix: Optional[FeedbackMatrix] = None,
+              guesses: Optional[List[str]] = None) -> 'DecisionTree':
+        algo_func = ALGORITHMS[strategy]
+        matrix = matrix if matrix is not None else FeedbackMatrix.load(words, guesses=guesses)
+        start = time.perf_counter()
+        node_guess: List[int] = []
+        children: List[Dict[int, int]] = []
+        depths: Dict[str, int] = {}
+        failures = 0
+        for secret in words:
+            guesses, _ = algo_func(words, secret, matrix=matrix)
+            secret_idx = matrix.index_of(secret)
+            node = 0
+            solved = False
+            for turn, word in enumerate(guesses):
+                guess = matrix.index_of(word)
+                if node == len(node_guess):
+                    node_guess.append(guess)
+                    children.append({})
+                elif node_guess[node] != guess:
+                    raise ValueError(f"{strategy} is not determined by feedback history (secret {secret!r})")
+                code = int(matrix.table[guess, secret_idx])
+                if code == SOLVED_CODE:
+                    depths[str(turn + 1)] = depths.get(str(turn + 1), 0) + 1
+                    solved = True
+                    break
+                if turn + 1 == len(guesses):
+                    break
+                node = children[node].setdefault(code, len(node_guess))
+            if not solved:
+                failures += 1
+        edge_start = np.zeros(len(node_guess) + 1, dtype=np.int32)
+        edge_code, edge_child = [], []
+        for node, edges in enumerate(children):
+            for code in sorted(edges):
+                edge_code.append(code)
+                edge_child.append(edges[code])
+            edge_start[node + 1] = len(edge_code)
+        stats = {
+            'nodes': len(node_guess),
+            'edges': len(edge_code),
+            'depth_histogram': dict(sorted(depths.items())),
+            'max_depth': max(map(int, depths)) if depths else 0,
+            'failures': failures,
+            'build_time_s': time.perf_counter() - start
+        }
+        return cls(matrix.words, strategy, np.array(node_guess, dtype=np.int32), edge_start,
+                   np.array(edge_code, dtype=np.uint8), np.array(edge_child, dtype=np.int32), stats)
+
+    @staticmethod
+    def cache_path(words: List[str], strategy: str, cache_dir: Optional[str] = None,
+                   guesses: Optional[List[str]] = None) -> str:
+        slug = re.sub(r'[^a-z0-9]+', '_', strategy.lower()).strip('_')
+        return os.path.join(cache_dir or CACHE_DIR, f"tree_v{TREE_VERSION}_{slug}_{dictionary_key(words, guesses)}.npz")
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            np.savez(f, guess=self.guess, edge_start=self.edge_start, edge_code=self.edge_code,
+                     edge_child=self.edge_child, words_hash=np.array(words_hash(self.words)),
+                     strategy=np.array(self.strategy), stats=np.array(json.dumps(self.stats)))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, words: List[str], strategy: str, cache_dir: Optional[str] = None,
+             matrix: Optional[FeedbackMatrix] = None, guesses: Optional[List[str]] = None) -> 'DecisionTree':
+        if guesses is None and matrix is not None and matrix.has_guess_list:
+            guesses = matrix.words
+        path = cls.cache_path(words, strategy, cache_dir, guesses)
+        guess_words = guess_list(words, guesses)
+        if os.path.exists(path):
+            try:
+                with np.load(path) as data:
+                    if str(data['words_hash']) == words_hash(guess_words) and str(data['strategy']) == strategy:
+                        return cls(guess_words, strategy, data['guess'], data['edge_start'], data['edge_code'],
+                                   data['edge_child'], json.loads(str(data['stats'])))
+            except (OSError, ValueError, KeyError):
+                pass
+        tree = cls.build(words, strategy, matrix, guesses)
+        tree.save(path)
+        return tree
+
+    def child(self, node: int, code: int) -> int:
+        start, end = self.edge_start[node], self.edge_start[node + 1]
+        pos = start + np.searchsorted(self.edge_code[start:end], code)
+        if pos < end and self.edge_code[pos] == code:
+            return int(self.edge_child[pos])
+        return -1
+
+class TreePlayer:
+    """Answers "next guess given history" by walking a DecisionTree."""
+
+    def __init__(self, tree: DecisionTree):
+        self.tree = tree
+
+    def next_guess(self, history: List[Tuple[str, str]]) -> Optional[str]:
+        tree = self.tree
+        node = 0
+        for guess, feedback in history:
+            if node < 0 or tree.words[tree.guess[node]] != guess:
+                return None
+            node = tree.child(node, encode_feedback(feedback))
+        return tree.words[tree.guess[node]] if node >= 0 else None
+
+    def solve(self, secret: str, matrix: FeedbackMatrix) -> Tuple[List[str], int]:
+        tree = self.tree
+        guesses = []
+        node = 0
+        while node >= 0:
+            guess = int(tree.guess[node])
+            guesses.append(tree.words[guess])
+            code = matrix.feedback(guess, secret)
+            if code == SOLVED_CODE:
+                break
+            node = tree.child(node, code)
+        return guesses, len(guesses)
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Precompute the decision tree of a solving strategy")
+    parser.add_argument('--algorithm', default="Entropy Search", choices=list(ALGORITHMS))
+    parser.add_argument('--words', default='five_letter_words.txt')
+    parser.add_argument('--guesses', help="allowed-guess list, if larger than the answer list")
+    parser.add_argument('--rebuild', action='store_true', help="ignore any cached tree")
+    args = parser.parse_args(argv)
+
+    words = load_words(args.words)
+    guesses = load_words(args.guesses) if args.guesses else None
+    try:
+        if args.rebuild:
+            tree = DecisionTree.build(words, args.algorithm, guesses=guesses)
+            tree.save(DecisionTree.cache_path(words, args.algorithm, guesses=guesses))
+        else:
+            tree = DecisionTree.load(words, args.algorithm, guesses=guesses)
+    except ValueError as e:
+        parser.error(str(e))
+    for key, value in tree.stats.items():
+        print(f"{key}: {value}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+import os
+from typing import Dict, List, Optional, Union
+import numpy as np
+from word_utils import WORD_LENGTH, words_hash
+
+CACHE_VERSION = 1
+CACHE_DIR = os.environ.get(
+    'WORDLE_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.wordle_cache')
+)
+NUM_PATTERNS = 3 ** WORD_LENGTH
+SOLVED_CODE = NUM_PATTERNS - 1
+_DIGITS = {'b': 0, 'y': 1, 'g': 2}
+_LETTERS = 'byg'
+_loaded: Dict[str, 'FeedbackMatrix'] = {}
+
+def encode_feedback(feedback: str) -> int:
+    code = 0
+    for c in reversed(feedback):
+        code = code * 3 + _DIGITS[c]
+    return code
+
+def decode_feedback(code: int) -> str:
+    feedback = []
+    for _ in range(WORD_LENGTH):
+        code, digit = divmod(int(code), 3)
+        feedback.append(_LETTERS[digit])
+    return ''.join(feedback)
+
+def encode_words(words: List[str]) -> np.ndarray:
+    raw = np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8)
+    return (raw.reshape(len(words), WORD_LENGTH) - ord('a')).astype(np.uint8)
+
+def compute_feedback_codes(guesses: np.ndarray, secrets: np.ndarray) -> np.ndarray:
+    """Pattern codes for every (guess, secret) pair of two encoded word arrays."""
+    g = [guesses[:, i, None] for i in range(WORD_LENGTH)]
+    s = [secrets[None, :, i] for i in range(WORD_LENGTH)]
+    green = [g[i] == s[i] for i in range(WORD_LENGTH)]
+    codes = np.zeros((len(guesses), len(secrets)), dtype=np.uint8)
+    weight = 1
+    for i in range(WORD_LENGTH):
+        available = np.zeros(codes.shape, dtype=np.uint8)
+        for k in range(WORD_LENGTH):
+            available += (g[i] == s[k]) & ~green[k]
+        for j in range(i):
+            available -= (g[i] == g[j]) & ~green[j] & (available > 0)
+        yellow = ~green[i] & (available > 0)
+        codes += (2 * green[i] + yellow).astype(np.uint8) * weight
+        weight *= 3
+    return codes
+
+def guess_list(answers: List[str], guesses: Optional[List[str]] = None) -> List[str]:
+    """Answers first (so answer i is also guess i), then the other allowed guesses sorted."""
+    if guesses is None:
+        return answers
+    known = set(answers)
+    return answers + sorted(set(guesses).difference(known))
+
+def dictionary_key(answers: List[str], guesses: Optional[List[str]] = None) -> str:
+    words = guess_list(answers, guesses)
+    key = words_hash(words)[:16]
+    return key if len(words) == len(answers) else f"{key}_{len(answers)}"
+
+class FeedbackMatrix:
+    """Guess x answer table of base-3 feedback codes.
+
+    Rows are the allowed guesses (words) and columns the possible answers. The guess
+    list starts with the answers in the same order, so candidate index arrays double
+    as guess indices. Without a separate guess list both lists are the same.
+    """
+
+    def __init__(self, words: List[str], table: np.ndarray):
+        self.words = words
+        self.answers = words if len(words) == table.shape[1] else words[:table.shape[1]]
+        self.table = table
+        self.index = {word: i for i, word in enumerate(words)}
+        self.memo: Dict = {}
+
+    @classmethod
+    def build(cls, answers: List[str], guesses: Optional[List[str]] = None, chunk_size: int = 256,
+              path: Optional[str] = None) -> 'FeedbackMatrix':
+        """Compute the table a chunk of guess rows at a time.
+
+        With a path the rows are written straight into a memory-mapped .npy file, so
+        peak memory stays at one chunk of temporaries however large the guess list is.
+        """
+        words = guess_list(answers, guesses)
+        encoded = encode_words(words)
+        shape = (len(words), len(answers))
+        if path is None:
+            table = np.empty(shape, dtype=np.uint8)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            table = np.lib.format.open_memmap(tmp, mode='w+', dtype=np.uint8, shape=shape)
+        for start in range(0, len(words), chunk_size):
+            stop = start + chunk_size
+            table[start:stop] = compute_feedback_codes(encoded[start:stop], encoded[:len(answers)])
+        if path is not None:
+            table.flush()
+            del table
+            os.replace(tmp, path)
+            table = np.load(path, mmap_mode='r')
+        return cls(words, table)
+
+    @classmethod
+    def load(cls, words: List[str], cache_dir: Optional[str] = None,
+             guesses: Optional[List[str]] = None) -> 'FeedbackMatrix':
+        """Table for answer list words (and an optional larger guess list), cached on disk."""
+        path = cls.cache_path(words, cache_dir, guesses)
+        if path in _loaded:
+            return _loaded[path]
+        matrix = None
+        if os.path.exists(path):
+            try:
+                table = np.load(path, mmap_mode='r')
+                if table.shape == (len(guess_list(words, guesses)), len(words)):
+                    matrix = cls(guess_list(words, guesses), table)
+            except (OSError, ValueError):
+                pass
+        if matrix is None:
+            matrix = cls.build(words, guesses, path=path)
+        _loaded[path] = matrix
+        return matrix
+
+    @staticmethod
+    def cache_path(words: List[str], cache_dir: Optional[str] = None, guesses: Optional[List[str]] = None) -> str:
+        name = f"feedback_v{CACHE_VERSION}_{dictionary_key(words, guesses)}.npy"
+        return os.path.join(cache_dir or CACHE_DIR, name)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    @property
+    def has_guess_list(self) -> bool:
+        return len(self.words) > len(self.answers)
+
+    def index_of(self, word: Union[str, int]) -> int:
+        return self.index[word] if isinstance(word, str) else int(word)
+
+    def indices(self, words: List[str]) -> np.ndarray:
+        return np.fromiter((self.index[w] for w in words), dtype=np.intp, count=len(words))
+
+    def all_indices(self) -> np.ndarray:
+        """Every answer: the starting candidate set."""
+        return np.arange(len(self.answers), dtype=np.intp)
+
+    def guess_indices(self) -> np.ndarray:
+        return np.arange(len(self.words), dtype=np.intp)
+
+    def feedback(self, guess: Union[str, int], secret: Union[str, int]) -> int:
+        return int(self.table[self.index_of(guess), self.index_of(secret)])
+
+    def filter(self, candidates: np.ndarray, guess: Union[str, int], feedback: Union[str, int]) -> np.ndarray:
+        code = encode_feedback(feedback) if isinstance(feedback, str) else feedback
+        return candidates[self.table[self.index_of(guess), candidates] == code]
+
+    def partition(self, guess: Union[str, int], candidates: np.ndarray) -> Dict[int, np.ndarray]:
+        codes = self.table[self.index_of(guess), candidates]
+        order = np.argsort(codes, kind='stable')
+        sorted_codes = codes[order]
+        bounds = np.flatnonzero(np.diff(sorted_codes)) + 1
+        return {int(codes[group[0]]): candidates[group]
+                for group in np.split(order, bounds) if len(group)}
+
+    def to_words(self, candidates: np.ndarray) -> List[str]:
+        return [self.words[i] for i in candidates]
@@ -0,0 +1,55 @@
+from collections import Counter
+from typing import Dict, Iterable, List
+from word_utils import WORD_LENGTH, calculate_heuristic, split_words
+
+class FrequencyTracker:
+    """Letter counts (overall and per position) of a shrinking candidate set.
+
+    Counts are kept in sync by subtracting the words each filter step eliminates,
+    so a turn costs O(removed) count updates instead of a pass over the survivors
+    (when more words are removed than kept, the survivors are recounted instead).
+    letter_freq has the same shape as get_letter_frequencies(), so it can be passed
+    straight to calculate_heuristic to score against the live candidates.
+    """
+
+    def __init__(self, words: List[str]):
+        self.candidates = list(words)
+        self._recount()
+
+    def _recount(self):
+        self.letter_freq: Dict[str, int] = dict(Counter(''.join(self.candidates)))
+        self.position_freq: List[Dict[str, int]] = [dict(Counter(word[i] for word in self.candidates))
+                                                    for i in range(WORD_LENGTH)]
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def remove(self, words: Iterable[str]):
+        letter_freq, position_freq = self.letter_freq, self.position_freq
+        for word in words:
+            for i, c in enumerate(word):
+                letter_freq[c] -= 1
+                position_freq[i][c] -= 1
+                if not letter_freq[c]:
+                    del letter_freq[c]
+                if not position_freq[i][c]:
+                    del position_freq[i][c]
+
+    def update(self, survivors: List[str], removed: List[str]):
+        """Shrink the candidate set to survivors; removed are the current candidates not among them."""
+        if len(removed) > len(survivors):
+            self.candidates = survivors
+            self._recount()
+            return
+        self.remove(removed)
+        self.candidates = survivors
+
+    def filter(self, guess: str, feedback: str) -> List[str]:
+        self.update(*split_words(self.candidates, guess, feedback))
+        return self.candidates
+
+    def heuristic(self, word: str) -> float:
+        return calculate_heuristic(word, self.letter_freq)
+
+    def position_frequency(self, position: int, letter: str) -> int:
+        return self.position_freq[position].get(letter, 0)
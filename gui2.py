@@ -1,11 +1,24 @@
+import os
+import re
+import statistics
 import tkinter as tk
 from tkinter import ttk, messagebox
-import time
-from typing import Dict
-import matplotlib.pyplot as plt # type: ignore
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg # type: ignore
-from algorithms import best_first_search, astar_search, aostar_search, dfs_search
-from word_utils import get_feedback
+from typing import Dict, List, Optional, Tuple
+from algorithms import ALGORITHMS
+from assist import AssistSession
+from candidate_browser import CandidateBrowser
+from comparison_chart import ComparisonDashboard, LIGHT_THEME
+from feedback_matrix import FeedbackMatrix, decode_feedback
+from result_cache import ResultCache
+from solver_pool import SolveDispatcher
+from timing import DEFAULT_REPEATS, DEFAULT_WARMUP, format_summary, summarize_times
+from word_store import WordStore
+from word_utils import load_words
+
+POLL_INTERVAL_MS = 50
+PROFILE_DIR = 'profiles'
+ALLOWED_GUESSES_FILE = 'allowed_guesses.txt'
+ASSIST_PREVIEW = 40
 
 class WordleSolverGUI:
     def __init__(self, root):
@@ -15,21 +28,29 @@ class WordleSolverGUI:
         self.root.configure(padx=30, pady=30, bg="#121212")  # Darker background with more padding
 
         try:
-            with open('five_letter_words.txt') as f:
-                self.words = [line.strip().lower() for line in f.readlines() if len(line.strip()) == 5]
-            if not self.words:
+            self.store = WordStore.open('five_letter_words.txt')
+            if not len(self.store):
                 raise ValueError("No valid 5-letter words found in the file")
         except FileNotFoundError:
             messagebox.showerror("Error", "Could not find five_letter_words.txt")
             self.root.destroy()
             return
-
-        self.algorithms = {
-            "Best First Search": best_first_search,
-            "A* Search": astar_search,
-            "AO* Search": aostar_search,
-            "Depth First Search": dfs_search
-        }
+        # an optional larger guess list; secrets still come from five_letter_words.txt
+        guesses = load_words(ALLOWED_GUESSES_FILE) if os.path.exists(ALLOWED_GUESSES_FILE) else None
+        # the GUI keeps the store (membership) and the matrix's word list, which the solvers need
+        # anyway; no list of its own outlives this constructor
+        self.matrix = FeedbackMatrix.load(self.store.word_list(), guesses=guesses)
+        answers = self.matrix.answers
+        self.dispatcher = SolveDispatcher(answers, guesses=guesses, cache=ResultCache(answers, guesses))
+        self.pending_secret = None
+        self.queued_secrets: List[str] = []
+        self.secret_count = 0
+        self.timing: Optional[Tuple[int, int, bool]] = None
+        self.results = {}
+        self.errors: List[str] = []
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.algorithms = dict(ALGORITHMS)
         self._setup_styles()
         self.create_widgets()
 
@@ -145,7 +166,7 @@ class WordleSolverGUI:
         word_frame = ttk.Frame(input_frame, style="TFrame")
         word_frame.pack(fill='x', pady=(5, 10))
 
-        title_label = ttk.Label(word_frame, text="Enter secret word:", style="NeonPink.TLabel")
+        title_label = ttk.Label(word_frame, text="Enter secret word(s):", style="NeonPink.TLabel")
         title_label.pack(side='left', padx=(0, 10))
 
         self.secret_word_entry = ttk.Entry(word_frame, 
@@ -169,6 +190,7 @@ class WordleSolverGUI:
                                    padx=15,
                                    pady=8)
         compare_button.pack(side='left', padx=(0, 10))
+        self.compare_button = compare_button
 
         clear_button = tk.Button(button_frame,
                                  text="Clear",
@@ -183,11 +205,50 @@ class WordleSolverGUI:
                                  pady=8)
         clear_button.pack(side='left')
 
+        cancel_button = tk.Button(button_frame,
+                                  text="Cancel",
+                                  command=self.cancel,
+                                  state='disabled',
+                                  font=("Arial", 11, "bold"),
+                                  fg="#FFFFFF",  # White text
+                                  bg="#95A5A6",  # Professional gray
+                                  activebackground="#7F8C8D",  # Darker gray on hover
+                                  activeforeground="#FFFFFF",  # White text on hover
+                                  relief="flat",
+                                  padx=15,
+                                  pady=8)
+        cancel_button.pack(side='left', padx=(10, 0))
+        self.cancel_button = cancel_button
+
+        self.profile_var = tk.BooleanVar(value=False)
+        profile_check = ttk.Checkbutton(button_frame, text="Profile", variable=self.profile_var)
+        profile_check.pack(side='left', padx=(20, 0))
+
+        self.progress = ttk.Progressbar(button_frame, mode='determinate', length=200)
+        self.progress.pack(side='left', padx=(20, 10))
+
+        self.status_label = ttk.Label(button_frame, text="", style="Info.TLabel")
+        self.status_label.pack(side='left')
+
+        timing_frame = ttk.Frame(input_frame, style="TFrame")
+        timing_frame.pack(fill='x', pady=(10, 0))
+        self.timing_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(timing_frame, text="Accurate timing", variable=self.timing_var).pack(side='left')
+        ttk.Label(timing_frame, text="Warmup:", style="Primary.TLabel").pack(side='left', padx=(20, 5))
+        self.warmup_var = tk.IntVar(value=DEFAULT_WARMUP)
+        ttk.Spinbox(timing_frame, from_=0, to=20, width=4, textvariable=self.warmup_var).pack(side='left')
+        ttk.Label(timing_frame, text="Repeats:", style="Primary.TLabel").pack(side='left', padx=(20, 5))
+        self.repeats_var = tk.IntVar(value=DEFAULT_REPEATS)
+        ttk.Spinbox(timing_frame, from_=2, to=200, width=4, textvariable=self.repeats_var).pack(side='left')
+        self.gc_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(timing_frame, text="Disable GC while timing", variable=self.gc_var).pack(side='left', padx=(20, 0))
+
         # Notebook with improved styling
         self.notebook = ttk.Notebook(self.root, style="TNotebook")
         self.notebook.pack(fill='both', expand=True, pady=(0, 15))
 
         self.tree_tabs = {}
+        self.candidate_browsers = {}
         for name in self.algorithms:
             tab = ttk.Frame(self.notebook, style="TFrame", padding=10)
             self.notebook.add(tab, text=name)
@@ -204,6 +265,10 @@ class WordleSolverGUI:
             tree.column('Feedback', width=200, anchor='center')
             
             tree.pack(side='left', fill='both', expand=True)
+
+            browser = CandidateBrowser(tab, self.matrix, LIGHT_THEME)
+            browser.pack(side='right', fill='both', padx=(10, 0))
+            self.candidate_browsers[name] = browser
             
             scrollbar = ttk.Scrollbar(tab, 
                                     orient='vertical',
@@ -213,6 +278,9 @@ class WordleSolverGUI:
             tree.configure(yscrollcommand=scrollbar.set)
             self.tree_tabs[name] = tree
 
+        self._create_assist_tab()
+        self._create_comparison_tab()
+
         # Statistics frame with enhanced styling
         self.stats_frame = ttk.LabelFrame(self.root, 
                                         text="Statistics",
@@ -235,196 +303,265 @@ class WordleSolverGUI:
                                     style="NeonPink.TLabel")
         self.length_label.pack(pady=3)
 
+        self.timing_label = ttk.Label(self.stats_frame,
+                                    text="Timing: single run per algorithm",
+                                    style="NeonBlue.TLabel",
+                                    font=("Courier", 9),
+                                    justify='left')
+        self.timing_label.pack(pady=3)
+
+    def _create_assist_tab(self):
+        tab = ttk.Frame(self.notebook, style="TFrame", padding=10)
+        self.notebook.add(tab, text="Assist")
+        self.assist = AssistSession(self.matrix.answers, self.matrix)
+
+        controls = ttk.Frame(tab, style="TFrame")
+        controls.pack(fill='x', pady=(0, 10))
+        ttk.Label(controls, text="Guess:", style="Primary.TLabel").pack(side='left')
+        self.assist_guess_entry = ttk.Entry(controls, font=("Arial", 11), style="TEntry", width=8)
+        self.assist_guess_entry.pack(side='left', padx=5)
+        ttk.Label(controls, text="Colors (g/y/b):", style="Primary.TLabel").pack(side='left', padx=(10, 0))
+        self.assist_feedback_entry = ttk.Entry(controls, font=("Arial", 11), style="TEntry", width=8)
+        self.assist_feedback_entry.pack(side='left', padx=5)
+        self.assist_feedback_entry.bind('<Return>', lambda event: self.assist_apply())
+        ttk.Button(controls, text="Add", style="Custom.TButton", command=self.assist_apply).pack(side='left', padx=5)
+        self.assist_undo_button = ttk.Button(controls, text="Undo", style="Custom.TButton", command=self.assist_undo)
+        self.assist_undo_button.pack(side='left', padx=5)
+        self.assist_redo_button = ttk.Button(controls, text="Redo", style="Custom.TButton", command=self.assist_redo)
+        self.assist_redo_button.pack(side='left', padx=5)
+        ttk.Button(controls, text="Reset", style="Custom.TButton", command=self.assist_reset).pack(side='left', padx=5)
+        self.assist_algorithm = tk.StringVar(value=self.assist.algorithm)
+        algorithm_box = ttk.Combobox(controls, textvariable=self.assist_algorithm, values=list(self.algorithms),
+                                     state='readonly', width=24)
+        algorithm_box.pack(side='right')
+        algorithm_box.bind('<<ComboboxSelected>>', lambda event: self._refresh_assist())
+
+        self.assist_suggestion_label = ttk.Label(tab, text="", style="Secondary.TLabel")
+        self.assist_suggestion_label.pack(fill='x', pady=3)
+        self.assist_candidates_label = ttk.Label(tab, text="", style="Info.TLabel", wraplength=900)
+        self.assist_candidates_label.pack(fill='x', pady=(0, 10))
+
+        self.assist_tree = ttk.Treeview(tab, columns=('Guess', 'Feedback'), show='headings', style="Treeview", height=6)
+        self.assist_tree.heading('Guess', text='Guess')
+        self.assist_tree.heading('Feedback', text='Feedback')
+        self.assist_tree.column('Guess', width=150, anchor='center')
+        self.assist_tree.column('Feedback', width=200, anchor='center')
+        self.assist_tree.pack(fill='both', expand=True)
+        self.assist_polling = False
+        self._refresh_assist()
+
+    def _create_comparison_tab(self):
+        self.comparison_tab = ttk.Frame(self.notebook, style="TFrame", padding=10)
+        self.notebook.add(self.comparison_tab, text="Comparison")
+        self.comparison = ComparisonDashboard(self.comparison_tab, list(self.algorithms), LIGHT_THEME)
+
+    def assist_apply(self):
+        try:
+            self.assist.apply(self.assist_guess_entry.get(), self.assist_feedback_entry.get())
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self.assist_feedback_entry.delete(0, tk.END)
+        self._refresh_assist()
+
+    def assist_undo(self):
+        self.assist.undo()
+        self._refresh_assist()
+
+    def assist_redo(self):
+        self.assist.redo()
+        self._refresh_assist()
+
+    def assist_reset(self):
+        self.assist.reset()
+        self._refresh_assist()
+
+    def _refresh_assist(self):
+        self.assist_tree.delete(*self.assist_tree.get_children())
+        for guess, feedback in self.assist.history:
+            self.assist_tree.insert('', 'end', values=(guess.upper(), self.feedback_to_emoji(feedback)))
+        candidates = self.assist.candidate_words
+        self.assist_guess_entry.delete(0, tk.END)
+        if not candidates:
+            self.assist_suggestion_label.config(text="No dictionary word matches these colors; undo the last step")
+        elif len(candidates) == 1:
+            self._show_assist_suggestion(candidates[0])
+        else:
+            # planners can take seconds; compute in the solver pool and pick the answer up in _poll_assist
+            algorithm = self.assist_algorithm.get()
+            suggestion = self.assist.cached_suggestion(algorithm)
+            if suggestion is not None:
+                self._show_assist_suggestion(suggestion)
+            else:
+                self.assist_suggestion_label.config(text=f"{len(candidates)} candidates, computing a suggestion...")
+                key = self.assist.suggestion_key(algorithm)
+                self.dispatcher.request_suggestion(key, algorithm, self.assist.candidates, key[1])
+                if not self.assist_polling:
+                    self.assist_polling = True
+                    self.root.after(POLL_INTERVAL_MS, self._poll_assist)
+        shown = ' '.join(candidates[:ASSIST_PREVIEW])
+        if len(candidates) > ASSIST_PREVIEW:
+            shown += f" ... (+{len(candidates) - ASSIST_PREVIEW} more)"
+        self.assist_candidates_label.config(text=shown)
+        self.assist_undo_button.config(state='normal' if self.assist.can_undo else 'disabled')
+        self.assist_redo_button.config(state='normal' if self.assist.can_redo else 'disabled')
+        self.assist_feedback_entry.focus_set()
+
+    def _show_assist_suggestion(self, suggestion: str):
+        candidates = len(self.assist.candidates)
+        self.assist_suggestion_label.config(text=f"Answer: {suggestion.upper()}" if candidates == 1
+                                            else f"{candidates} candidates, suggested guess: {suggestion.upper()}")
+        # the user may have started typing a guess of their own while the suggestion was computed
+        if not self.assist_guess_entry.get():
+            self.assist_guess_entry.insert(0, suggestion)
+
+    def _poll_assist(self):
+        current = self.assist.suggestion_key(self.assist_algorithm.get())
+        for key, guess, error in self.dispatcher.poll_suggestions():
+            if error is not None:
+                if key == current:
+                    self.assist_suggestion_label.config(text=f"Suggestion failed: {type(error).__name__}: {error}")
+                continue
+            # suggestions for states the user already left stay cached for undo/redo
+            self.assist.remember_suggestion(key, guess)
+            if key == current:
+                self._show_assist_suggestion(self.assist.matrix.words[guess])
+        if self.dispatcher.suggesting:
+            self.root.after(POLL_INTERVAL_MS, self._poll_assist)
+        else:
+            self.assist_polling = False
+
     def clear(self):
+        self.cancel()
         self.secret_word_entry.delete(0, tk.END)
         for tree in self.tree_tabs.values():
             tree.delete(*tree.get_children())
+        for browser in self.candidate_browsers.values():
+            browser.clear()
         self.time_label.config(text="Time taken: -")
         self.guesses_label.config(text="Total guesses tried: -")
         self.length_label.config(text="Solution length: -")
+        self.timing_label.config(text="Timing: single run per algorithm")
+        self.comparison.clear()
 
     def feedback_to_emoji(self, feedback: str) -> str:
         emoji_map = {'g': '🟩', 'y': '🟨', 'b': '⬛'}
         return ''.join(emoji_map[c] for c in feedback)
 
     def solve(self):
-        secret_word = self.secret_word_entry.get().strip().lower()
-        if len(secret_word) != 5 or secret_word not in self.words:
-            messagebox.showerror("Error", "Invalid 5-letter word")
+        secrets = [word for word in re.split(r'[\s,]+', self.secret_word_entry.get().strip().lower()) if word]
+        invalid = [word for word in secrets if len(word) != 5 or word not in self.store]
+        if not secrets or invalid:
+            messagebox.showerror("Error", f"Invalid 5-letter word: {invalid[0]}" if invalid else "Invalid 5-letter word")
             return
 
-        results = {}
-        for name, algo_func in self.algorithms.items():
-            tree = self.tree_tabs[name]
+        for tree in self.tree_tabs.values():
             tree.delete(*tree.get_children())
-            start = time.time()
-            guesses, _ = algo_func(self.words, secret_word)
-            end = time.time()
-            if guesses:
-                results[name] = {
-                    'time': end - start,
-                    'guesses': len(guesses)
-                }
-                for guess in guesses:
-                    feedback = get_feedback(secret_word, guess)
-                    emoji_feedback = self.feedback_to_emoji(feedback)
-                    tree.insert('', 'end', values=(guess.upper(), emoji_feedback))
+        self.results = {}
+        self.errors = []
+        self.queued_secrets = secrets
+        self.secret_count = len(secrets)
+        self.timing = self._timing()
+        self.progress.configure(maximum=len(self.algorithms) * len(secrets), value=0)
+        self.compare_button.config(state='disabled')
+        self.cancel_button.config(state='normal')
+        self._submit_next()
+
+    def _submit_next(self):
+        self.pending_secret = self.queued_secrets.pop(0)
+        if self.secret_count > 1:
+            for tree in self.tree_tabs.values():
+                tree.insert('', 'end', values=(f"-- {self.pending_secret.upper()} --", ''))
+        profile_dir = PROFILE_DIR if self.profile_var.get() else None
+        self.dispatcher.submit(list(self.algorithms), self.pending_secret, profile_dir, self.timing)
+        self._update_progress()
+        self.root.after(POLL_INTERVAL_MS, self._poll_results)
+
+    def _timing(self) -> Optional[Tuple[int, int, bool]]:
+        """(warmup, repeats, disable_gc) when accurate timing is on."""
+        if not self.timing_var.get():
+            return None
+        try:
+            return max(self.warmup_var.get(), 0), max(self.repeats_var.get(), 2), self.gc_var.get()
+        except tk.TclError:
+            return DEFAULT_WARMUP, DEFAULT_REPEATS, self.gc_var.get()
+
+    def _update_progress(self):
+        done = (self.secret_count - len(self.queued_secrets)) * len(self.algorithms) - self.dispatcher.pending_count
+        self.progress.configure(value=done)
+        self.status_label.config(text=f"Solving {done}/{len(self.algorithms) * self.secret_count}")
+
+    def _poll_results(self):
+        if self.pending_secret is None:
+            return
+        for name, guesses, samples, error in self.dispatcher.poll():
+            if error is not None or not guesses:
+                message = f"{type(error).__name__}: {error}" if error is not None else "no guesses returned"
+                self.errors.append(f"{name} ({self.pending_secret}): {message}")
+                self.tree_tabs[name].insert('', 'end', values=("Error", message))
+                self.candidate_browsers[name].clear()
+                continue
+            result = self.results.setdefault(name, {'time': [], 'guesses': [], 'samples': []})
+            result['time'].append(statistics.median(samples))
+            if self.timing is not None:
+                result['samples'].extend(samples)
+            result['guesses'].append(len(guesses))
+            tree = self.tree_tabs[name]
+            for guess in guesses:
+                feedback = decode_feedback(self.matrix.feedback(guess, self.pending_secret))
+                emoji_feedback = self.feedback_to_emoji(feedback)
+                tree.insert('', 'end', values=(guess.upper(), emoji_feedback))
+            self.candidate_browsers[name].set_game(guesses, self.pending_secret)
+        self._update_progress()
+        if self.errors:
+            self.status_label.config(text=f"{self.status_label.cget('text')}, {len(self.errors)} failed")
+        if self.dispatcher.busy:
+            self.root.after(POLL_INTERVAL_MS, self._poll_results)
+        elif self.queued_secrets:
+            self._submit_next()
+        else:
+            self._finish_solve()
+
+    def _finish_solve(self):
+        self.pending_secret = None
+        self.compare_button.config(state='normal')
+        self.cancel_button.config(state='disabled')
+        self.status_label.config(text=f"Done, profiles in {PROFILE_DIR}/" if self.profile_var.get()
+                                 else f"Done, results {self.dispatcher.cache.format_stats()}")
+        results = self.results
         if results:
-            self.time_label.config(text=f"Time taken: {sum(r['time'] for r in results.values()):.2f} s")
-            self.guesses_label.config(text=f"Total guesses tried: {sum(r['guesses'] for r in results.values())}")
-            self.length_label.config(text=f"Average solution length: {sum(r['guesses'] for r in results.values()) // len(results)}")
+            total_guesses = sum(sum(r['guesses']) for r in results.values())
+            self.time_label.config(text=f"Time taken: {sum(sum(r['time']) for r in results.values()):.2f} s")
+            self.guesses_label.config(text=f"Total guesses tried: {total_guesses}")
+            self.length_label.config(text=f"Average solution length: {total_guesses / sum(len(r['guesses']) for r in results.values()):.2f}")
+            if self.timing is not None:
+                self.timing_label.config(text='\n'.join(f"{name:<24} {format_summary(summarize_times(r['samples']))}"
+                                                        for name, r in results.items()))
+            else:
+                self.timing_label.config(text="Timing: single run per algorithm")
             self.show_comparison_chart(results)
-        else:
+        elif not self.errors:
             messagebox.showinfo("Result", "No solution found for any algorithm")
+        if self.errors:
+            self.status_label.config(text=f"Done, {len(self.errors)} failed")
+            messagebox.showerror("Error", "\n".join(self.errors[:10]))
 
-    def show_comparison_chart(self, results: Dict[str, Dict[str, float]]):
-        popup = tk.Toplevel(self.root)
-        popup.title("Algorithm Comparison")
-        popup.geometry("1400x800")  # Increased height for better visualization
-        popup.configure(bg="#121212")
-        
-        # Add a title at the top
-        title_frame = ttk.Frame(popup, style="TFrame")
-        title_frame.pack(fill='x', padx=20, pady=(20,10))
-        
-        title_label = ttk.Label(title_frame, 
-                              text="Algorithm Performance Comparison",
-                              style="TLabel",
-                              font=("Arial", 16, "bold"),
-                              foreground="#00FFB3")
-        title_label.pack()
-
-        container = ttk.Frame(popup, style="TFrame")
-        container.pack(fill='both', expand=True, padx=20, pady=(0,20))
-
-        # Enhanced feedback frame
-        feedback_frame = ttk.LabelFrame(container, 
-                                      text="Detailed Results",
-                                      style="TLabelframe",
-                                      padding=15)
-        feedback_frame.pack(side='left', fill='both', expand=True, padx=(0,10))
-
-        # Enhanced treeview
-        feedback_tree = ttk.Treeview(feedback_frame, 
-                                   columns=('Algorithm', 'Time', 'Guesses'),
-                                   show='headings',
-                                   style="Treeview",
-                                   height=8)
-        
-        feedback_tree.heading('Algorithm', text='Algorithm')
-        feedback_tree.heading('Time', text='Time (s)')
-        feedback_tree.heading('Guesses', text='Guesses')
-        
-        # Set column widths and alignment
-        feedback_tree.column('Algorithm', width=150, anchor='center')
-        feedback_tree.column('Time', width=100, anchor='center')
-        feedback_tree.column('Guesses', width=100, anchor='center')
-
-        scrollbar = ttk.Scrollbar(feedback_frame,
-                                orient='vertical',
-                                command=feedback_tree.yview,
-                                style="Vertical.TScrollbar")
-        scrollbar.pack(side='right', fill='y')
-        feedback_tree.configure(yscrollcommand=scrollbar.set)
-        feedback_tree.pack(fill='both', expand=True)
-
-        for algo in results:
-            feedback_tree.insert('', 'end', values=(
-                algo,
-                f"{results[algo]['time']:.2f}",
-                results[algo]['guesses']
-            ))
-
-        # Enhanced graph frame
-        graph_frame = ttk.LabelFrame(container,
-                                   text="Visual Analysis",
-                                   style="TLabelframe",
-                                   padding=15)
-        graph_frame.pack(side='right', fill='both', expand=True)
-
-        plt.style.use('dark_background')
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(8, 10))
-        fig.patch.set_facecolor('#121212')
-        
-        algorithms = list(results.keys())
-        times = [results[algo]['time'] for algo in algorithms]
-        guesses = [results[algo]['guesses'] for algo in algorithms]
-        
-        # Enhanced color palette
-        colors = ['#00FFB3', '#FF1493', '#00BFFF', '#FFD700']
-        
-        # Style for both plots
-        for ax in [ax1, ax2]:
-            ax.set_facecolor('#1E1E1E')
-            ax.grid(True, linestyle='--', alpha=0.2)
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['bottom'].set_color('#2D2D2D')
-            ax.spines['left'].set_color('#2D2D2D')
-
-        # Time comparison plot
-        bars1 = ax1.bar(algorithms, times, color=colors)
-        ax1.set_title("Time Taken (seconds)", 
-                     color='#00FFB3',
-                     fontsize=12,
-                     pad=15,
-                     font='Arial')
-        ax1.set_ylabel("Time (s)",
-                      color='#00BFFF',
-                      fontsize=10,
-                      font='Arial')
-        ax1.tick_params(axis='both', colors='#00BFFF')
-        
-        # Add value labels on the bars
-        for bar in bars1:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.2f}s',
-                    ha='center',
-                    va='bottom',
-                    color='#FFFFFF',
-                    font='Arial')
-
-        # Guesses comparison plot
-        bars2 = ax2.bar(algorithms, guesses, color=colors)
-        ax2.set_title("Number of Guesses",
-                     color='#00FFB3',
-                     fontsize=12,
-                     pad=15,
-                     font='Arial')
-        ax2.set_ylabel("Guesses",
-                      color='#00BFFF',
-                      fontsize=10,
-                      font='Arial')
-        ax2.tick_params(axis='both', colors='#00BFFF')
-        
-        # Add value labels on the bars
-        for bar in bars2:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{int(height)}',
-                    ha='center',
-                    va='bottom',
-                    color='#FFFFFF',
-                    font='Arial')
-
-        # Rotate x-axis labels for better readability
-        for ax in [ax1, ax2]:
-            ax.set_xticklabels(algorithms,
-                              rotation=15,
-                              ha='right',
-                              color='#00BFFF',
-                              font='Arial')
-
-        fig.tight_layout(pad=5.0)
-        
-        # Create and pack the canvas with proper styling
-        canvas = FigureCanvasTkAgg(fig, master=graph_frame)
-        canvas.draw()
-        canvas_widget = canvas.get_tk_widget()
-        canvas_widget.configure(bg="#121212",
-                              highlightthickness=0)
-        canvas_widget.pack(fill='both',
-                          expand=True,
-                          padx=5,
-                          pady=5)
+    def cancel(self):
+        if self.pending_secret is None:
+            return
+        self.dispatcher.cancel()
+        self.pending_secret = None
+        self.queued_secrets = []
+        self.compare_button.config(state='normal')
+        self.cancel_button.config(state='disabled')
+        self.progress.configure(value=0)
+        self.status_label.config(text="Cancelled")
+
+    def close(self):
+        self.dispatcher.close()
+        self.comparison.close()
+        self.root.destroy()
+
+    def show_comparison_chart(self, results: Dict[str, Dict[str, List[float]]]):
+        self.comparison.update(results)
+        self.notebook.select(self.comparison_tab)
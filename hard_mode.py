@@ -0,0 +1,107 @@
+import hashlib
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+from feedback_matrix import FeedbackMatrix, decode_feedback, encode_words
+from scoring import ALPHABET
+from word_utils import WORD_LENGTH
+
+def hints(guess: str, feedback: Union[str, int]) -> Tuple[List[Optional[str]], Dict[str, int]]:
+    """Green letter per position and minimum count per revealed letter that later guesses must reuse."""
+    if not isinstance(feedback, str):
+        feedback = decode_feedback(feedback)
+    greens: List[Optional[str]] = [None] * WORD_LENGTH
+    counts: Dict[str, int] = {}
+    for i, (letter, mark) in enumerate(zip(guess, feedback)):
+        if mark == 'g':
+            greens[i] = letter
+        if mark != 'b':
+            counts[letter] = counts.get(letter, 0) + 1
+    return greens, counts
+
+def is_hard_mode_guess(word: str, history: List[Tuple[str, str]]) -> bool:
+    """Check a guess against every earlier hint (the unindexed reference check)."""
+    for guess, feedback in history:
+        greens, counts = hints(guess, feedback)
+        if any(letter is not None and word[i] != letter for i, letter in enumerate(greens)):
+            return False
+        if any(word.count(letter) < count for letter, count in counts.items()):
+            return False
+    return True
+
+def mask_fingerprint(mask: np.ndarray) -> bytes:
+    return hashlib.blake2b(np.packbits(mask).tobytes(), digest_size=16).digest()
+
+class HardModeIndex:
+    """Precomputed guess masks over a dictionary: letter at a position, at least k of a letter."""
+
+    def __init__(self, words: List[str]):
+        letters = encode_words(words).astype(np.intp)
+        rows = np.arange(len(words))
+        self.size = len(words)
+        self.position = np.zeros((WORD_LENGTH, ALPHABET, len(words)), dtype=bool)
+        counts = np.zeros((len(words), ALPHABET), dtype=np.int8)
+        for i in range(WORD_LENGTH):
+            self.position[i, letters[:, i], rows] = True
+            np.add.at(counts, (rows, letters[:, i]), 1)
+        self.at_least = counts.T[:, None, :] >= np.arange(WORD_LENGTH + 1)[None, :, None]
+
+    def position_mask(self, position: int, letter: str) -> np.ndarray:
+        return self.position[position, ord(letter) - ord('a')]
+
+    def count_mask(self, letter: str, count: int) -> np.ndarray:
+        return self.at_least[ord(letter) - ord('a'), count]
+
+    def hint_mask(self, guess: str, feedback: Union[str, int]) -> np.ndarray:
+        """Guesses that reuse every hint of one (guess, feedback) pair."""
+        greens, counts = hints(guess, feedback)
+        mask = np.ones(self.size, dtype=bool)
+        for i, letter in enumerate(greens):
+            if letter is not None:
+                mask &= self.position_mask(i, letter)
+        for letter, count in counts.items():
+            mask &= self.count_mask(letter, count)
+        return mask
+
+def get_index(matrix: FeedbackMatrix) -> HardModeIndex:
+    if 'hard_mode_index' not in matrix.memo:
+        matrix.memo['hard_mode_index'] = HardModeIndex(matrix.words)
+    return matrix.memo['hard_mode_index']
+
+class HardModeConstraints:
+    """Hints accumulated over one game and the mask of guesses that still honor all of them.
+
+    A new guess only ANDs in the masks of hints it adds (a newly fixed green, a higher
+    minimum count), so a turn costs a handful of precomputed-mask ANDs rather than a
+    re-check of every earlier hint against every word.
+    """
+
+    def __init__(self, index: HardModeIndex):
+        self.index = index
+        self.greens: List[Optional[str]] = [None] * WORD_LENGTH
+        self.min_counts: Dict[str, int] = {}
+        self.allowed = np.ones(index.size, dtype=bool)
+        self.restricted = False
+
+    def add(self, guess: str, feedback: Union[str, int]) -> np.ndarray:
+        greens, counts = hints(guess, feedback)
+        # a new array each time, so masks handed out earlier (e.g. to planner nodes) never change
+        allowed = self.allowed
+        for i, letter in enumerate(greens):
+            if letter is not None and self.greens[i] is None:
+                self.greens[i] = letter
+                allowed = allowed & self.index.position_mask(i, letter)
+        for letter, count in counts.items():
+            if count > self.min_counts.get(letter, 0):
+                self.min_counts[letter] = count
+                allowed = allowed & self.index.count_mask(letter, count)
+        self.restricted = self.restricted or allowed is not self.allowed
+        self.allowed = allowed
+        return allowed
+
+    def allows(self, word: str) -> bool:
+        return (all(letter is None or word[i] == letter for i, letter in enumerate(self.greens))
+                and all(word.count(letter) >= count for letter, count in self.min_counts.items()))
+
+    def guess_pool(self) -> Optional[np.ndarray]:
+        """Indices of the allowed guesses, or None while every word is still allowed."""
+        return np.flatnonzero(self.allowed) if self.restricted else None
@@ -0,0 +1,105 @@
+import time
+from typing import Dict, Optional, Set, Tuple
+import numpy as np
+from aostar import fingerprint
+from feedback_matrix import FeedbackMatrix, SOLVED_CODE
+
+class SearchLimitExceeded(Exception):
+    pass
+
+class IterativeDeepeningDFS:
+    """Finds a guess that solves every remaining candidate within the smallest depth.
+
+    A guess works at depth d when each of its feedback buckets is solvable at depth
+    d - 1. Guesses are tried in the order of the candidate array (callers pass it
+    ranked by heuristic), guesses that cannot separate the last two levels are cut
+    without partitioning, and (candidate set, depth) results are kept in a
+    transposition table shared by every call. The node and time limits make a call
+    give up instead of hanging.
+    """
+
+    def __init__(self, matrix: FeedbackMatrix, node_limit: Optional[int] = 20_000,
+                 time_limit: Optional[float] = 0.25):
+        self.matrix = matrix
+        self.node_limit = node_limit
+        self.time_limit = time_limit
+        self.nodes = 0
+        self.tt_hits = 0
+        self.limit_hits = 0
+        self._failed: Dict[bytes, int] = {}
+        self._solved: Dict[bytes, Tuple[int, int]] = {}
+        self._given_up: Set[bytes] = set()
+
+    def best_guess(self, candidates: np.ndarray, max_depth: int) -> Tuple[int, Optional[int]]:
+        """Return (guess, guaranteed depth); the depth is None when no guarantee was found."""
+        if len(candidates) <= 2:
+            return int(candidates[0]), len(candidates)
+        key = fingerprint(candidates)
+        if key not in self._given_up:
+            self._budget = self.nodes + self.node_limit if self.node_limit is not None else None
+            self._deadline = time.perf_counter() + self.time_limit if self.time_limit is not None else None
+            try:
+                for depth in range(2, max_depth + 1):
+                    guess = self._search(candidates, depth, key)
+                    if guess is not None:
+                        return guess, depth
+            except SearchLimitExceeded:
+                self.limit_hits += 1
+                self._given_up.add(key)
+        return int(candidates[0]), None
+
+    def _tick(self):
+        self.nodes += 1
+        if self._budget is not None and self.nodes > self._budget:
+            raise SearchLimitExceeded()
+        if self._deadline is not None and self.nodes % 64 == 0 and time.perf_counter() > self._deadline:
+            raise SearchLimitExceeded()
+
+    def _search(self, candidates: np.ndarray, depth: int, key: bytes) -> Optional[int]:
+        size = len(candidates)
+        if size == 1:
+            return int(candidates[0])
+        if depth <= 1:
+            return None
+        if size == 2:
+            return int(candidates[0])
+        solved = self._solved.get(key)
+        if solved is not None and solved[0] <= depth:
+            self.tt_hits += 1
+            return solved[1]
+        if self._failed.get(key, 0) >= depth:
+            self.tt_hits += 1
+            return None
+        table = self.matrix.table
+        for guess in candidates.tolist():
+            self._tick()
+            codes = table[guess, candidates]
+            if depth == 2:
+                # one guess left after this one: every other bucket must be a single word
+                if len(np.unique(codes)) == size:
+                    return self._remember(key, depth, guess)
+                continue
+            buckets = self.matrix.partition(guess, candidates)
+            remaining = sorted((bucket for code, bucket in buckets.items() if code != SOLVED_CODE),
+                               key=len, reverse=True)
+            if all(self._search(bucket, depth - 1, fingerprint(bucket)) is not None for bucket in remaining):
+                return self._remember(key, depth, guess)
+        self._failed[key] = depth
+        return None
+
+    def _remember(self, key: bytes, depth: int, guess: int) -> int:
+        self._solved[key] = (depth, guess)
+        return guess
+
+    def stats(self) -> Dict:
+        return {
+            'nodes': self.nodes,
+            'tt_hits': self.tt_hits,
+            'tt_size': len(self._failed) + len(self._solved),
+            'limit_hits': self.limit_hits
+        }
+
+def get_search(matrix: FeedbackMatrix) -> IterativeDeepeningDFS:
+    if 'iddfs' not in matrix.memo:
+        matrix.memo['iddfs'] = IterativeDeepeningDFS(matrix)
+    return matrix.memo['iddfs']
@@ -0,0 +1,151 @@
+import cProfile
+import functools
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+import aostar
+import iddfs
+import scoring
+import word_utils
+from algorithms import ALGORITHMS
+
+# (module or class, attribute); times are inclusive, so the scoring done inside a planner
+# call is counted under both
+HOT_FUNCTIONS = (
+    (word_utils, 'get_feedback'), (word_utils, 'filter_words'), (word_utils, 'split_words'),
+    (word_utils, 'calculate_heuristic'),
+    (scoring, 'entropy_scores'), (scoring, 'heuristic_scores'),
+    (aostar.AOStarPlanner, 'best_guess'), (aostar.AOStarPlanner, 'expand'),
+    (iddfs.IterativeDeepeningDFS, 'best_guess')
+)
+
+def counter_name(owner, attribute: str) -> str:
+    return f"{owner.__name__}.{attribute}" if isinstance(owner, type) else attribute
+
+def slugify(name: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+
+class Instrumentation:
+    """Opt-in counters and timers around the hot functions and every solver.
+
+    Nothing is wrapped until the context is entered, so disabled runs pay no overhead.
+    On entry the hot functions are swapped for counting wrappers in every loaded module
+    that imported them (planner methods on their class), and the ALGORITHMS entries are wrapped to record one run each:
+    wall time, one turn per filter_words or split_words call (candidate sizes and latency) and,
+    optionally, traced allocations and a cProfile dump.
+    """
+
+    def __init__(self, track_allocations: bool = False, profile_dir: Optional[str] = None):
+        self.track_allocations = track_allocations
+        self.profile_dir = profile_dir
+        self.calls = {counter_name(*hot): {'calls': 0, 'total_ns': 0} for hot in HOT_FUNCTIONS}
+        self.runs: List[Dict] = []
+        self._current: Optional[Dict] = None
+        self._patched: List = []
+        self._algorithms: Dict[str, Callable] = {}
+        self._started_tracemalloc = False
+
+    def __enter__(self) -> 'Instrumentation':
+        self.enable()
+        return self
+
+    def __exit__(self, *exc):
+        self.disable()
+
+    def enable(self):
+        if self._patched or self._algorithms:
+            return
+        for owner, name in HOT_FUNCTIONS:
+            original = getattr(owner, name)
+            wrapper = self._wrap_hot(counter_name(owner, name), original)
+            if isinstance(owner, type):
+                setattr(owner, name, wrapper)
+                self._patched.append((owner, name, original))
+                continue
+            for module in list(sys.modules.values()):
+                namespace = getattr(module, '__dict__', None)
+                if namespace is not None and namespace.get(name) is original:
+                    setattr(module, name, wrapper)
+                    self._patched.append((module, name, original))
+        for name, algo_func in ALGORITHMS.items():
+            self._algorithms[name] = algo_func
+            ALGORITHMS[name] = self._wrap_algorithm(name, algo_func)
+        if self.track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def disable(self):
+        for module, name, original in reversed(self._patched):
+            setattr(module, name, original)
+        self._patched.clear()
+        ALGORITHMS.update(self._algorithms)
+        self._algorithms.clear()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _wrap_hot(self, name: str, func: Callable) -> Callable:
+        counter = self.calls[name]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            result = func(*args, **kwargs)
+            elapsed = time.perf_counter_ns() - start
+            counter['calls'] += 1
+            counter['total_ns'] += elapsed
+            if name in ('filter_words', 'split_words') and self._current is not None:
+                now = time.perf_counter_ns()
+                self._current['turns'].append({
+                    'candidates_in': len(args[0]),
+                    'candidates_out': len(result[0] if name == 'split_words' else result),
+                    'filter_ns': elapsed,
+                    'turn_ns': now - self._current['_turn_start']
+                })
+                self._current['_turn_start'] = now
+            return result
+        return wrapper
+
+    def _wrap_algorithm(self, name: str, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(words, secret, **kwargs):
+            run = {'algorithm': name, 'secret': secret, 'turns': []}
+            previous, self._current = self._current, run
+            profiler = cProfile.Profile() if self.profile_dir else None
+            if self.track_allocations:
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+            start = run['_turn_start'] = time.perf_counter_ns()
+            try:
+                if profiler is not None:
+                    result = profiler.runcall(func, words, secret, **kwargs)
+                else:
+                    result = func(words, secret, **kwargs)
+            finally:
+                run['wall_ns'] = time.perf_counter_ns() - start
+                del run['_turn_start']
+                self._current = previous
+            if self.track_allocations:
+                current, peak = tracemalloc.get_traced_memory()
+                run['alloc_net_bytes'] = current - before
+                run['alloc_peak_bytes'] = peak - before
+            if profiler is not None:
+                os.makedirs(self.profile_dir, exist_ok=True)
+                path = os.path.join(self.profile_dir, f"{slugify(name)}_{secret}_{len(self.runs)}.pstats")
+                profiler.dump_stats(path)
+                run['profile'] = path
+            run['guesses'] = list(result[0])
+            self.runs.append(run)
+            return result
+        return wrapper
+
+    def report(self) -> Dict:
+        return {'calls': self.calls, 'runs': self.runs}
+
+    def write_json(self, path: str):
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
@@ -1,7 +1,6 @@
-from gui import WordleSolverGUI
-import tkinter as tk
-
 def main():
+    import tkinter as tk
+    from gui import WordleSolverGUI
     root = tk.Tk()
     app = WordleSolverGUI(root)
     root.mainloop()
@@ -0,0 +1,165 @@
+import argparse
+import random
+import time
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+from feedback_matrix import FeedbackMatrix, NUM_PATTERNS, SOLVED_CODE, encode_feedback
+from scoring import heuristic_scores, letter_counts
+from timing import percentile
+from word_utils import load_words
+
+DEFAULT_STRATEGY = "Entropy Search"
+EXTRA_GUESSES = 5  # Quordle allows 9 guesses for 4 boards, Octordle 13 for 8
+
+def distinct_boards(boards: List[np.ndarray]) -> Tuple[List[np.ndarray], np.ndarray]:
+    """Boards with identical candidates (every board on the first turn) scored once, with a weight."""
+    seen: Dict[bytes, int] = {}
+    unique, weights = [], []
+    for board in boards:
+        key = board.tobytes()
+        if key in seen:
+            weights[seen[key]] += 1
+        else:
+            seen[key] = len(unique)
+            unique.append(board)
+            weights.append(1)
+    return unique, np.array(weights)
+
+def joint_entropy_scores(matrix: FeedbackMatrix, boards: List[np.ndarray], guess_pool: Optional[np.ndarray] = None,
+                         chunk_size: int = 256, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """Sum over boards of each guess's feedback entropy.
+
+    The boards' candidates are laid side by side, so each chunk of guesses gathers its
+    pattern codes once and a single bincount (offset per board) counts every board.
+    """
+    if guess_pool is None:
+        guess_pool = matrix.guess_indices()
+    if weights is None:
+        weights = np.ones(len(boards))
+    sizes = np.array([len(board) for board in boards])
+    columns = np.concatenate(boards)
+    offsets = np.repeat(np.arange(len(boards)) * NUM_PATTERNS, sizes)
+    slots = len(boards) * NUM_PATTERNS
+    counts_range = np.arange(sizes.max() + 1)
+    xlogx = counts_range * np.log2(np.maximum(counts_range, 1))
+    totals = np.empty((len(guess_pool), len(boards)))
+    for start in range(0, len(guess_pool), chunk_size):
+        rows = guess_pool[start:start + chunk_size]
+        codes = matrix.table[rows][:, columns].astype(np.intp)
+        codes += offsets
+        codes += np.arange(len(rows))[:, None] * slots
+        counts = np.bincount(codes.ravel(), minlength=len(rows) * slots)
+        totals[start:start + len(rows)] = xlogx[counts].reshape(len(rows), len(boards), NUM_PATTERNS).sum(axis=2)
+    return (np.log2(sizes) - totals / sizes) @ weights
+
+def _entropy_guess(matrix: FeedbackMatrix, boards: List[np.ndarray]) -> int:
+    full = all(len(board) == len(matrix.answers) for board in boards)
+    if full and 'multiboard_opener' in matrix.memo:
+        return matrix.memo['multiboard_opener']
+    boards, weights = distinct_boards(boards)
+    scores = joint_entropy_scores(matrix, boards, weights=weights)
+    for board, weight in zip(boards, weights):
+        # chance of solving that board outright with this guess
+        scores[board] += weight / len(board)
+    guess = int(np.argmax(scores))
+    if full:
+        matrix.memo['multiboard_opener'] = guess
+    return guess
+
+def _astar_guess(matrix: FeedbackMatrix, boards: List[np.ndarray]) -> int:
+    letter_freq = sum(letter_counts(matrix, board)[0] for board in boards)
+    candidates = np.unique(np.concatenate(boards))
+    return int(candidates[np.argmax(heuristic_scores(matrix, candidates, letter_freq))])
+
+JOINT_STRATEGIES = {
+    "Entropy Search": _entropy_guess,
+    "A* Search": _astar_guess
+}
+
+class MultiBoardSolver:
+    """One candidate set per board, all narrowed by the same guesses.
+
+    Solved boards are dropped from scoring; a board down to a single candidate is
+    guessed straight away, since that guess costs nothing the board does not need anyway.
+    """
+
+    def __init__(self, matrix: FeedbackMatrix, boards: int, strategy: str = DEFAULT_STRATEGY):
+        self.matrix = matrix
+        self.strategy = strategy
+        self.candidates = [matrix.all_indices() for _ in range(boards)]
+        self.solved = [False] * boards
+
+    @property
+    def active(self) -> List[int]:
+        return [board for board, solved in enumerate(self.solved) if not solved]
+
+    @property
+    def done(self) -> bool:
+        return all(self.solved)
+
+    def suggest(self) -> int:
+        """Next guess; ValueError when the feedback so far has left no board with a candidate."""
+        boards = [self.candidates[board] for board in self.active if len(self.candidates[board])]
+        if not boards:
+            raise ValueError("No candidates left on any unsolved board; the feedback is contradictory")
+        for board in boards:
+            if len(board) == 1:
+                return int(board[0])
+        return JOINT_STRATEGIES[self.strategy](self.matrix, boards)
+
+    def apply(self, guess: Union[str, int], feedback: List[Union[str, int]]):
+        """Record one guess and the feedback of every board (solved boards' entries are ignored)."""
+        for board in self.active:
+            code = encode_feedback(feedback[board]) if isinstance(feedback[board], str) else int(feedback[board])
+            if code == SOLVED_CODE:
+                self.solved[board] = True
+                self.candidates[board] = self.candidates[board][:0]
+            else:
+                self.candidates[board] = self.matrix.filter(self.candidates[board], guess, code)
+
+def solve_boards(matrix: FeedbackMatrix, secrets: List[str], strategy: str = DEFAULT_STRATEGY,
+                 max_guesses: Optional[int] = None) -> Tuple[List[str], List[Optional[int]], List[float]]:
+    """Play every board to the end; returns the guesses, the turn each board was solved and suggestion times."""
+    max_guesses = max_guesses or len(secrets) + EXTRA_GUESSES
+    solver = MultiBoardSolver(matrix, len(secrets), strategy)
+    secret_idx = [matrix.index_of(secret) for secret in secrets]
+    solved_at: List[Optional[int]] = [None] * len(secrets)
+    guesses, latencies = [], []
+    while not solver.done and len(guesses) < max_guesses:
+        start = time.perf_counter()
+        guess = solver.suggest()
+        latencies.append(time.perf_counter() - start)
+        guesses.append(matrix.words[guess])
+        active = solver.active
+        solver.apply(guess, [matrix.table[guess, idx] for idx in secret_idx])
+        for board in active:
+            if solver.solved[board]:
+                solved_at[board] = len(guesses)
+    return guesses, solved_at, latencies
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Play Quordle/Octordle-style games with a joint strategy")
+    parser.add_argument('--words', default='five_letter_words.txt')
+    parser.add_argument('--boards', type=int, default=4)
+    parser.add_argument('--games', type=int, default=20)
+    parser.add_argument('--strategy', default=DEFAULT_STRATEGY, choices=list(JOINT_STRATEGIES))
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    words = load_words(args.words)
+    matrix = FeedbackMatrix.load(words)
+    rng = random.Random(args.seed)
+    lengths, latencies = [], []
+    failures = 0
+    for _ in range(args.games):
+        guesses, solved_at, game_latencies = solve_boards(matrix, rng.sample(words, args.boards), args.strategy)
+        lengths.append(len(guesses))
+        failures += any(turn is None for turn in solved_at)
+        latencies.extend(game_latencies)
+    ms = [latency * 1e3 for latency in latencies]
+    print(f"{args.games} games, {args.boards} boards, {args.strategy}")
+    print(f"Mean guesses: {sum(lengths) / len(lengths):.2f} (limit {args.boards + EXTRA_GUESSES}), failed games: {failures}")
+    print(f"Suggestion ms: p50 {percentile(ms, 50):.2f}, p99 {percentile(ms, 99):.2f}, max {max(ms):.2f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+import hashlib
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+from algorithms import NONDETERMINISTIC
+from feedback_matrix import CACHE_DIR, dictionary_key
+
+RESULTS_VERSION = 2
+RESULTS_FILE = 'results.sqlite3'
+TABLE = f'results_v{RESULTS_VERSION}'
+MEMORY_ENTRIES = 8192
+# every module whose code can change the guesses an algorithm makes
+SOLVER_MODULES = ('algorithms', 'aostar', 'iddfs', 'scoring', 'frequency_tracker', 'hard_mode',
+                  'word_utils', 'feedback_matrix')
+_algorithm_version: Optional[str] = None
+_CHECKOUT = os.path.dirname(os.path.abspath(__file__))
+
+Result = Tuple[List[str], float]
+
+def algorithm_version() -> str:
+    """Hash of the solver sources, so editing any of them invalidates every cached result."""
+    global _algorithm_version
+    if _algorithm_version is None:
+        digest = hashlib.sha256(str(RESULTS_VERSION).encode())
+        for module in SOLVER_MODULES:
+            with open(os.path.join(_CHECKOUT, f"{module}.py"), 'rb') as f:
+                digest.update(f.read().replace(b'\r\n', b'\n'))
+        _algorithm_version = digest.hexdigest()[:16]
+    return _algorithm_version
+
+class ResultCache:
+    """Solved games keyed by (algorithm, algorithm version, dictionary, secret, hard mode).
+
+    Rows live in SQLite next to the feedback tables; an in-memory LRU in front answers
+    repeated lookups without a query. The dictionary key hashes the word lists, so a
+    changed five_letter_words.txt misses. Rows are tagged with the checkout that wrote them,
+    and opening the cache drops only this checkout's rows from older solver code, so
+    checkouts sharing WORDLE_CACHE_DIR keep their own. Algorithms in NONDETERMINISTIC
+    always miss and are never stored.
+    """
+
+    def __init__(self, answers: List[str], guesses: Optional[List[str]] = None, path: Optional[str] = None,
+                 memory_entries: int = MEMORY_ENTRIES):
+        self.dictionary = dictionary_key(answers, guesses)
+        self.version = algorithm_version()
+        self.path = path or os.path.join(CACHE_DIR, RESULTS_FILE)
+        self.memory_entries = memory_entries
+        self._memory: 'OrderedDict[Tuple[str, str, bool], Result]' = OrderedDict()
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'uncacheable': 0}
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        # the GUI and a batch run may share the file; WAL lets one read while the other writes
+        self._db = sqlite3.connect(self.path, timeout=30)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        with self._db:
+            self._db.execute(f'CREATE TABLE IF NOT EXISTS {TABLE} (checkout TEXT, algorithm TEXT, version TEXT, '
+                             'dictionary TEXT, secret TEXT, hard_mode INTEGER, guesses TEXT, seconds REAL, '
+                             'created REAL, PRIMARY KEY (checkout, algorithm, version, dictionary, secret, hard_mode))')
+            self._db.execute(f'DELETE FROM {TABLE} WHERE checkout = ? AND version != ?', (_CHECKOUT, self.version))
+
+    @property
+    def hits(self) -> int:
+        return self.stats['memory_hits'] + self.stats['disk_hits']
+
+    def _remember(self, key: Tuple[str, str, bool], result: Result):
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    def get(self, name: str, secret: str, hard_mode: bool = False) -> Optional[Result]:
+        """(guesses, seconds of the original solve), or None on a miss."""
+        return self.get_many(name, [secret], hard_mode).get(secret)
+
+    def get_many(self, name: str, secrets: Iterable[str], hard_mode: bool = False) -> Dict[str, Result]:
+        if name in NONDETERMINISTIC:
+            self.stats['uncacheable'] += len(list(secrets))
+            return {}
+        found = {}
+        missing = []
+        for secret in secrets:
+            key = (name, secret, hard_mode)
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                found[secret] = self._memory[key]
+                self.stats['memory_hits'] += 1
+            else:
+                missing.append(secret)
+        if missing:
+            # one query for the whole (algorithm, mode) slice is cheaper than one per secret
+            rows = self._db.execute(f'SELECT secret, guesses, seconds FROM {TABLE} WHERE checkout = ? '
+                                    'AND algorithm = ? AND version = ? AND dictionary = ? AND hard_mode = ?',
+                                    (_CHECKOUT, name, self.version, self.dictionary, int(hard_mode))).fetchall()
+            stored = {secret: (guesses.split(), seconds) for secret, guesses, seconds in rows}
+            for secret in missing:
+                if secret in stored:
+                    found[secret] = stored[secret]
+                    self._remember((name, secret, hard_mode), stored[secret])
+                    self.stats['disk_hits'] += 1
+                else:
+                    self.stats['misses'] += 1
+        return found
+
+    def put(self, name: str, secret: str, guesses: List[str], seconds: float, hard_mode: bool = False):
+        self.put_many([(name, secret, guesses, seconds, hard_mode)])
+
+    def put_many(self, results: List[Tuple[str, str, List[str], float, bool]]):
+        """Store (name, secret, guesses, seconds, hard_mode) rows in one transaction."""
+        results = [result for result in results if result[0] not in NONDETERMINISTIC]
+        if not results:
+            return
+        now = time.time()
+        with self._db:
+            self._db.executemany(f'INSERT OR REPLACE INTO {TABLE} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                                 [(_CHECKOUT, name, self.version, self.dictionary, secret, int(hard_mode),
+                                   ' '.join(guesses), seconds, now)
+                                  for name, secret, guesses, seconds, hard_mode in results])
+        for name, secret, guesses, seconds, hard_mode in results:
+            self._remember((name, secret, hard_mode), (list(guesses), seconds))
+        self.stats['stores'] += len(results)
+
+    def clear(self):
+        """Drop this checkout's rows."""
+        self._memory.clear()
+        with self._db:
+            self._db.execute(f'DELETE FROM {TABLE} WHERE checkout = ?', (_CHECKOUT,))
+
+    def format_stats(self) -> str:
+        lookups = self.hits + self.stats['misses']
+        return (f"{self.hits}/{lookups} cached ({self.stats['memory_hits']} memory, {self.stats['disk_hits']} disk), "
+                f"{self.stats['stores']} stored, {self.stats['uncacheable']} not cacheable")
+
+    def close(self):
+        self._db.close()
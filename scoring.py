@@ -0,0 +1,81 @@
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+from feedback_matrix import FeedbackMatrix, NUM_PATTERNS, encode_words
+from word_utils import WORD_LENGTH
+
+ALPHABET = 26
+SORTED_COUNT_LIMIT = 16
+
+def entropy_scores(matrix: FeedbackMatrix, candidates: np.ndarray, guess_pool: Optional[np.ndarray] = None,
+                   chunk_size: int = 64) -> np.ndarray:
+    """Shannon entropy (bits) of each guess's feedback-pattern distribution over the candidates.
+
+    Only the candidates' columns are read. Small sets count patterns from sorted rows, which
+    skips the per-guess 243-bin histogram that dominates a bincount pass at that size.
+    """
+    if guess_pool is None:
+        guess_pool = matrix.guess_indices()
+    n = len(candidates)
+    if n <= SORTED_COUNT_LIMIT:
+        return _sorted_entropy(matrix, candidates, guess_pool)
+    counts_range = np.arange(n + 1)
+    xlogx = counts_range * np.log2(np.maximum(counts_range, 1))
+    offsets = np.arange(chunk_size, dtype=np.intp)[:, None] * NUM_PATTERNS
+    totals = np.empty(len(guess_pool))
+    for start in range(0, len(guess_pool), chunk_size):
+        rows = guess_pool[start:start + chunk_size]
+        codes = matrix.table[np.ix_(rows, candidates)] + offsets[:len(rows)]
+        counts = np.bincount(codes.ravel(), minlength=len(rows) * NUM_PATTERNS)
+        totals[start:start + len(rows)] = xlogx[counts].reshape(len(rows), NUM_PATTERNS).sum(axis=1)
+    return np.log2(n) - totals / n
+
+def _sorted_entropy(matrix: FeedbackMatrix, candidates: np.ndarray, guess_pool: np.ndarray) -> np.ndarray:
+    n = len(candidates)
+    codes = np.sort(matrix.table[np.ix_(guess_pool, candidates)], axis=1)
+    # each run of equal codes in a sorted row is one feedback bucket
+    starts = np.ones(codes.shape, dtype=bool)
+    starts[:, 1:] = codes[:, 1:] != codes[:, :-1]
+    first = np.flatnonzero(starts.ravel())
+    sizes = np.diff(np.append(first, codes.size)).astype(np.float64)
+    totals = np.bincount(first // n, weights=sizes * np.log2(sizes), minlength=len(guess_pool))
+    return np.log2(n) - totals / n
+
+def letter_tables(matrix: FeedbackMatrix) -> Tuple[np.ndarray, np.ndarray]:
+    """(letters, presence): n x 5 letter codes and the n x 26 0/1 matrix of each word's distinct letters."""
+    if 'letter_tables' not in matrix.memo:
+        letters = encode_words(matrix.words)
+        presence = np.zeros((len(letters), ALPHABET))
+        presence[np.arange(len(letters))[:, None], letters] = 1
+        matrix.memo['letter_tables'] = (letters, presence)
+    return matrix.memo['letter_tables']
+
+def letter_counts(matrix: FeedbackMatrix, candidates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Overall (26,) and positional (5, 26) letter counts of the candidates."""
+    letters = letter_tables(matrix)[0][candidates]
+    overall = np.bincount(letters.ravel(), minlength=ALPHABET)
+    positional = np.stack([np.bincount(letters[:, i], minlength=ALPHABET) for i in range(WORD_LENGTH)])
+    return overall, positional
+
+def _count_array(freq: Dict[str, int]) -> np.ndarray:
+    counts = np.zeros(ALPHABET)
+    for c, count in freq.items():
+        counts[ord(c) - ord('a')] = count
+    return counts
+
+def heuristic_scores(matrix: FeedbackMatrix, candidates: np.ndarray,
+                     letter_freq: Union[Dict[str, int], List[Dict[str, int]], np.ndarray],
+                     positional: bool = False) -> np.ndarray:
+    """calculate_heuristic for every candidate at once.
+
+    letter_freq is a get_letter_frequencies() dict or a (26,) count array. With positional=True
+    it is a list of five per-position dicts or a (5, 26) array, and a word scores the count of
+    each of its letters at the position it occupies.
+    """
+    letters, presence = letter_tables(matrix)
+    if positional:
+        if not isinstance(letter_freq, np.ndarray):
+            letter_freq = np.stack([_count_array(freq) for freq in letter_freq])
+        return letter_freq[np.arange(WORD_LENGTH), letters[candidates]].sum(axis=1).astype(np.float64)
+    if not isinstance(letter_freq, np.ndarray):
+        letter_freq = _count_array(letter_freq)
+    return presence[candidates] @ letter_freq
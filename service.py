@@ -0,0 +1,294 @@
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import signal
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from algorithms import ALGORITHMS
+from assist import AssistSession, DEFAULT_ALGORITHM
+from feedback_matrix import FeedbackMatrix
+from solver_pool import init_worker, solve_in_worker, suggest_in_worker
+from word_utils import load_words
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+BATCH_WINDOW = 0.002
+MAX_BATCH = 64
+SUGGESTION_CACHE = 4096
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+class SuggestBatcher:
+    """Gathers suggest requests for a short window and sends the distinct ones to the pool as one task.
+
+    Requests are keyed like AssistSession suggestions, (algorithm, turn, candidate bitset):
+    concurrent requests for the same state wait on one future, and finished suggestions
+    stay in a small LRU so repeated states (every new game's opener) never reach the pool.
+    """
+
+    def __init__(self, pool: ProcessPoolExecutor, window: float = BATCH_WINDOW, max_batch: int = MAX_BATCH,
+                 cache_size: int = SUGGESTION_CACHE):
+        self.pool = pool
+        self.window = window
+        self.max_batch = max_batch
+        self.cache_size = cache_size
+        self._results: 'OrderedDict[Tuple[str, int, int], int]' = OrderedDict()
+        self._inflight: Dict[Tuple[str, int, int], asyncio.Future] = {}
+        self._batch: List[Tuple[Tuple[str, int, int], np.ndarray]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self.stats = {'requests': 0, 'cache_hits': 0, 'shared': 0, 'computed': 0, 'batches': 0}
+
+    async def suggest(self, algorithm: str, turn: int, bits: int, candidates: np.ndarray) -> int:
+        self.stats['requests'] += 1
+        key = (algorithm, turn, bits)
+        if key in self._results:
+            self.stats['cache_hits'] += 1
+            self._results.move_to_end(key)
+            return self._results[key]
+        if key in self._inflight:
+            self.stats['shared'] += 1
+            return await asyncio.shield(self._inflight[key])
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._inflight[key] = future
+        self._batch.append((key, candidates))
+        if len(self._batch) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        return await asyncio.shield(future)
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        self.stats['batches'] += 1
+        self.stats['computed'] += len(batch)
+        requests = [(algorithm, candidates, turn) for (algorithm, turn, _), candidates in batch]
+        task = asyncio.get_running_loop().run_in_executor(self.pool, suggest_in_worker, requests)
+        task.add_done_callback(lambda done: self._resolve(batch, done))
+
+    def _resolve(self, batch: List[Tuple[Tuple[str, int, int], np.ndarray]], done: asyncio.Future):
+        # a failed task (e.g. a dead worker) fails the whole batch; a failed request only itself
+        error = done.exception()
+        results = done.result() if error is None else [error] * len(batch)
+        for (key, _), guess in zip(batch, results):
+            future = self._inflight.pop(key)
+            if isinstance(guess, BaseException):
+                future.set_exception(guess)
+                continue
+            future.set_result(guess)
+            self._results[key] = guess
+            if len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+
+class WordleService:
+    """Solver endpoints over one loaded dictionary; CPU work runs in a process pool.
+
+    The feedback table is built (or memory-mapped) once in the server, which also keeps the
+    assist sessions; the workers map the same cached table when they start.
+    """
+
+    def __init__(self, words: List[str], guesses: Optional[List[str]] = None, processes: Optional[int] = None,
+                 window: float = BATCH_WINDOW, max_batch: int = MAX_BATCH):
+        self.words = words
+        self.matrix = FeedbackMatrix.load(words, guesses=guesses)
+        self.processes = processes or multiprocessing.cpu_count()
+        self.pool = ProcessPoolExecutor(self.processes, mp_context=multiprocessing.get_context('spawn'),
+                                        initializer=init_worker, initargs=(words, True, guesses))
+        self.batcher = SuggestBatcher(self.pool, window, max_batch)
+        self.sessions: Dict[str, AssistSession] = {}
+        self._session_ids = itertools.count(1)
+
+    async def warm_up(self):
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[loop.run_in_executor(self.pool, suggest_in_worker, [])
+                               for _ in range(self.processes)])
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+    @staticmethod
+    def _algorithm(body: dict) -> str:
+        algorithm = body.get('algorithm', DEFAULT_ALGORITHM)
+        if algorithm not in ALGORITHMS:
+            raise HTTPError(400, f"Unknown algorithm {algorithm!r}; choose from {list(ALGORITHMS)}")
+        return algorithm
+
+    def _session(self, session_id: str) -> AssistSession:
+        if session_id not in self.sessions:
+            raise HTTPError(404, f"No session {session_id!r}")
+        return self.sessions[session_id]
+
+    async def _suggestion(self, session: AssistSession, algorithm: Optional[str] = None) -> dict:
+        bits = session.bits
+        candidates = session.candidates
+        suggestion = None
+        if bits:
+            guess = await self.batcher.suggest(algorithm or session.algorithm, len(session.history), bits, candidates)
+            suggestion = self.matrix.words[guess]
+        return {'suggestion': suggestion, 'candidates': len(candidates)}
+
+    @staticmethod
+    def _state(session_id: str, session: AssistSession) -> dict:
+        return {'session': session_id, 'algorithm': session.algorithm,
+                'history': [list(step) for step in session.history], 'candidates': len(session.candidates),
+                'can_undo': session.can_undo, 'can_redo': session.can_redo}
+
+    async def solve(self, body: dict) -> dict:
+        algorithm = self._algorithm(body)
+        secret = str(body.get('secret', '')).strip().lower()
+        if secret not in self.matrix.index or self.matrix.index[secret] >= len(self.matrix.answers):
+            raise HTTPError(400, f"{secret!r} is not in the answer list")
+        loop = asyncio.get_running_loop()
+        guesses, seconds = await loop.run_in_executor(self.pool, solve_in_worker, algorithm, secret, None,
+                                                      bool(body.get('hard_mode', False)))
+        return {'algorithm': algorithm, 'secret': secret, 'guesses': guesses, 'seconds': seconds}
+
+    async def suggest(self, body: dict) -> dict:
+        """Stateless suggestion for a history of [guess, colors] pairs."""
+        algorithm = self._algorithm(body)
+        session = AssistSession(self.words, self.matrix, algorithm)
+        history = body.get('history', [])
+        if not isinstance(history, list):
+            raise HTTPError(400, "Bad history: expected a list of [guess, colors] pairs")
+        for step in history:
+            if not (isinstance(step, (list, tuple)) and len(step) == 2 and all(isinstance(s, str) for s in step)):
+                raise HTTPError(400, f"Bad history: expected [guess, colors] strings, got {step!r}")
+            try:
+                session.apply(*step)
+            except ValueError as e:
+                raise HTTPError(400, f"Bad history: {e}")
+        return await self._suggestion(session)
+
+    async def dispatch(self, method: str, path: str, body: dict) -> dict:
+        parts = [part for part in path.split('?', 1)[0].split('/') if part]
+        route = (method, *parts[:1], *(['*'] if len(parts) > 1 else []), *parts[2:])
+        if route == ('GET', 'health'):
+            return {'status': 'ok', 'answers': len(self.matrix.answers), 'guesses': len(self.matrix)}
+        if route == ('GET', 'algorithms'):
+            return {'algorithms': list(ALGORITHMS)}
+        if route == ('GET', 'stats'):
+            return {**self.batcher.stats, 'sessions': len(self.sessions), 'processes': self.processes}
+        if route == ('POST', 'solve'):
+            return await self.solve(body)
+        if route == ('POST', 'suggest'):
+            return await self.suggest(body)
+        if route == ('POST', 'sessions'):
+            session_id = str(next(self._session_ids))
+            self.sessions[session_id] = AssistSession(self.words, self.matrix, self._algorithm(body))
+            return self._state(session_id, self.sessions[session_id])
+        if len(parts) < 2 or parts[0] != 'sessions':
+            raise HTTPError(404, f"No route for {method} {path}")
+        session_id = parts[1]
+        session = self._session(session_id)
+        if route == ('GET', 'sessions', '*'):
+            return self._state(session_id, session)
+        if route == ('DELETE', 'sessions', '*'):
+            del self.sessions[session_id]
+            return {'session': session_id, 'deleted': True}
+        if route == ('GET', 'sessions', '*', 'suggest'):
+            return await self._suggestion(session, self._algorithm(body) if 'algorithm' in body else None)
+        if route == ('POST', 'sessions', '*', 'guess'):
+            try:
+                session.apply(str(body.get('guess', '')), str(body.get('feedback', '')))
+            except ValueError as e:
+                raise HTTPError(400, str(e))
+            return self._state(session_id, session)
+        if route in [('POST', 'sessions', '*', action) for action in ('undo', 'redo', 'reset')]:
+            if parts[2] == 'reset':
+                session.reset()
+            elif not getattr(session, parts[2])():
+                raise HTTPError(409, f"Nothing to {parts[2]}")
+            return self._state(session_id, session)
+        raise HTTPError(404, f"No route for {method} {path}")
+
+    async def handle(self, method: str, path: str, raw: bytes) -> Tuple[int, dict]:
+        try:
+            body = json.loads(raw) if raw.strip() else {}
+            if not isinstance(body, dict):
+                raise HTTPError(400, "Request body must be a JSON object")
+            return 200, await self.dispatch(method, path, body)
+        except json.JSONDecodeError as e:
+            return 400, {'error': f"Invalid JSON: {e}"}
+        except HTTPError as e:
+            return e.status, {'error': str(e)}
+        except Exception as e:
+            return 500, {'error': f"{type(e).__name__}: {e}"}
+
+    async def serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Minimal HTTP/1.1 with keep-alive: one JSON request and response at a time per connection."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line.strip():
+                    break
+                try:
+                    method, path, _ = line.decode('latin-1').split(' ', 2)
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    header = await reader.readline()
+                    if header in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = header.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get('content-length', 0) or 0)
+                raw = await reader.readexactly(length) if length else b''
+                status, payload = await self.handle(method.upper(), path, raw)
+                data = json.dumps(payload).encode()
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                writer.write(f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                             f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                             f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+async def serve(service: WordleService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+    await service.warm_up()
+    server = await asyncio.start_server(service.serve_connection, host, port)
+    print(f"Serving on http://{host}:{port} with {service.processes} worker processes", flush=True)
+    async with server:
+        await server.serve_forever()
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Local JSON service for solve, suggest and assist sessions")
+    parser.add_argument('--words', default='five_letter_words.txt')
+    parser.add_argument('--guesses', help="allowed-guess list, if larger than the answer list")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--processes', type=int, help="worker processes (default: CPU count)")
+    parser.add_argument('--batch-window', type=float, default=BATCH_WINDOW * 1e3, metavar='MS',
+                        help="how long suggest requests are gathered before a batch is sent")
+    parser.add_argument('--max-batch', type=int, default=MAX_BATCH)
+    args = parser.parse_args(argv)
+    service = WordleService(load_words(args.words), load_words(args.guesses) if args.guesses else None,
+                            args.processes, args.batch_window / 1e3, args.max_batch)
+    # a terminated server shuts its workers down too instead of orphaning them
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+import multiprocessing
+import multiprocessing.pool
+import os
+import time
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+from algorithms import ALGORITHMS, NEXT_GUESS
+from feedback_matrix import FeedbackMatrix
+from instrumentation import Instrumentation, slugify
+from result_cache import ResultCache
+from timing import measure
+
+_worker_words: List[str] = []
+_worker_matrix: Optional[FeedbackMatrix] = None
+
+def init_worker(words: List[str], use_matrix: bool = True, guesses: Optional[List[str]] = None):
+    global _worker_words, _worker_matrix
+    _worker_words = words
+    _worker_matrix = FeedbackMatrix.load(words, guesses=guesses) if use_matrix else None
+
+def solve_in_worker(name: str, secret: str, profile_dir: Optional[str] = None,
+                    hard_mode: bool = False) -> Tuple[List[str], float]:
+    if profile_dir is not None:
+        with Instrumentation(profile_dir=profile_dir) as instrumentation:
+            result = solve_in_worker(name, secret, hard_mode=hard_mode)
+        instrumentation.write_json(os.path.join(profile_dir, f"{slugify(name)}_{secret}.json"))
+        return result
+    algo_func = ALGORITHMS[name]
+    start = time.perf_counter_ns()
+    if _worker_matrix is not None:
+        guesses, _ = algo_func(_worker_words, secret, matrix=_worker_matrix, hard_mode=hard_mode)
+    else:
+        guesses, _ = algo_func(_worker_words, secret, hard_mode=hard_mode)
+    return guesses, (time.perf_counter_ns() - start) / 1e9
+
+def measure_in_worker(name: str, secret: str, warmup: int, repeats: int, disable_gc: bool = False,
+                      hard_mode: bool = False) -> Tuple[List[str], List[float]]:
+    """Warmed-up, repeated solves of one secret; the samples are in seconds."""
+    algo_func = ALGORITHMS[name]
+    options = {'matrix': _worker_matrix} if _worker_matrix is not None else {}
+    (guesses, _), samples = measure(lambda: algo_func(_worker_words, secret, hard_mode=hard_mode, **options),
+                                    warmup, repeats, disable_gc)
+    return guesses, [sample / 1e9 for sample in samples]
+
+def suggest_in_worker(requests: List[Tuple[str, np.ndarray, int]]) -> List[Union[int, Exception]]:
+    """Next-guess index for each (algorithm, candidate indices, turn) request of a batch.
+
+    A request that fails returns its exception in place, so it cannot fail the rest of the batch.
+    """
+    results: List[Union[int, Exception]] = []
+    for name, candidates, turn in requests:
+        try:
+            results.append(int(NEXT_GUESS[name](_worker_matrix, candidates, turn)))
+        except Exception as e:
+            results.append(e)
+    return results
+
+class SolveDispatcher:
+    """Runs algorithm solves in worker processes and hands results back as they finish.
+
+    The caller polls (e.g. from Tk's root.after) so no callback ever runs off the
+    main thread. cancel() terminates the workers, stopping in-flight solves.
+    With a result cache, plain solves already in it never reach the pool and new ones are stored.
+    """
+
+    def __init__(self, words: List[str], processes: Optional[int] = None, guesses: Optional[List[str]] = None,
+                 cache: Optional[ResultCache] = None):
+        self.words = words
+        self.guesses = guesses
+        self.processes = processes
+        self.cache = cache
+        self._pool = None
+        self._pending: Dict[str, multiprocessing.pool.AsyncResult] = {}
+        self._cached: List[Tuple[str, Optional[List[str]], List[float], Optional[BaseException]]] = []
+        # assist suggestions: state key -> (request, result); not part of busy, and kept across cancel()
+        self._suggesting: Dict[Tuple, Tuple[Tuple[str, np.ndarray, int], multiprocessing.pool.AsyncResult]] = {}
+        self._secret: Optional[str] = None
+        self._store = False
+
+    def _ensure_pool(self):
+        if self._pool is None:
+            # spawn keeps the Tk state of the parent out of the workers
+            context = multiprocessing.get_context('spawn')
+            self._pool = context.Pool(self.processes, initializer=init_worker,
+                                      initargs=(self.words, True, self.guesses))
+
+    def submit(self, names: List[str], secret: str, profile_dir: Optional[str] = None,
+               timing: Optional[Tuple[int, int, bool]] = None):
+        """Solve secret with each algorithm; timing=(warmup, repeats, disable_gc) times repeated solves."""
+        if self.busy:
+            self.cancel()
+        # repeated or profiled timings are measurements of this run, not results to reuse
+        self._store = self.cache is not None and timing is None and profile_dir is None
+        self._secret = secret
+        if self._store:
+            for name in names:
+                hit = self.cache.get(name, secret)
+                if hit is not None:
+                    self._cached.append((name, hit[0], [hit[1]], None))
+            names = [name for name in names if name not in {cached[0] for cached in self._cached}]
+            if not names:
+                return
+        FeedbackMatrix.load(self.words, guesses=self.guesses)
+        self._ensure_pool()
+        for name in names:
+            if timing is not None:
+                self._pending[name] = self._pool.apply_async(measure_in_worker, (name, secret, *timing))
+            else:
+                self._pending[name] = self._pool.apply_async(solve_in_worker, (name, secret, profile_dir))
+
+    def poll(self) -> List[Tuple[str, Optional[List[str]], List[float], Optional[BaseException]]]:
+        """Return (name, guesses, timed seconds, error) for every solve finished since the last poll.
+
+        A plain solve has one timed sample, a timed submit one per repetition.
+        """
+        finished, self._cached = self._cached, []
+        solved = []
+        for name, result in list(self._pending.items()):
+            if not result.ready():
+                continue
+            del self._pending[name]
+            try:
+                guesses, elapsed = result.get()
+                finished.append((name, guesses, elapsed if isinstance(elapsed, list) else [elapsed], None))
+                solved.append((name, self._secret, guesses, elapsed, False))
+            except Exception as e:
+                finished.append((name, None, [], e))
+        if self._store and solved:
+            self.cache.put_many(solved)
+        return finished
+
+    def request_suggestion(self, key: Tuple, algorithm: str, candidates: np.ndarray, turn: int):
+        """Compute NEXT_GUESS[algorithm] for the candidates in a worker; poll_suggestions returns it under key."""
+        if key in self._suggesting:
+            return
+        FeedbackMatrix.load(self.words, guesses=self.guesses)
+        self._ensure_pool()
+        request = (algorithm, candidates, turn)
+        self._suggesting[key] = (request, self._pool.apply_async(suggest_in_worker, ([request],)))
+
+    def poll_suggestions(self) -> List[Tuple[Tuple, Optional[int], Optional[BaseException]]]:
+        """(key, guess index, error) for every suggestion finished since the last poll."""
+        finished = []
+        for key, (_, result) in list(self._suggesting.items()):
+            if not result.ready():
+                continue
+            del self._suggesting[key]
+            try:
+                guess = result.get()[0]
+            except Exception as e:
+                finished.append((key, None, e))
+                continue
+            finished.append((key, None, guess) if isinstance(guess, Exception) else (key, guess, None))
+        return finished
+
+    @property
+    def suggesting(self) -> bool:
+        return bool(self._suggesting)
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._pending or self._cached)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending) + len(self._cached)
+
+    def cancel(self):
+        """Stop the solves; suggestions in flight are resubmitted to the new pool."""
+        self._pending.clear()
+        self._cached = []
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        suggesting, self._suggesting = self._suggesting, {}
+        for key, (request, _) in suggesting.items():
+            self.request_suggestion(key, *request)
+
+    def close(self):
+        self._suggesting.clear()
+        self.cancel()
+        if self.cache is not None:
+            self.cache.close()
@@ -0,0 +1,24 @@
+import argparse
+import os
+import subprocess
+import sys
+import pytest
+import cli
+
+ROOT = os.path.dirname(os.path.abspath(cli.__file__))
+
+def test_cli_import_time_within_budget():
+    assert cli.import_time_ms('cli') < cli.IMPORT_BUDGET_MS
+
+def test_cli_import_skips_gui_modules():
+    code = ("import sys, cli; print(' '.join(sorted(name for name in sys.modules "
+            "if name.split('.')[0] in cli.HEAVY_MODULES)))")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=ROOT)
+    assert result.stdout.strip() == ''
+
+def test_heavy_import_is_a_budget_failure(monkeypatch, capsys):
+    monkeypatch.setattr(cli, 'HEAVY_MODULES', ('numpy',))
+    with pytest.raises(cli.ImportBudgetError, match='numpy'):
+        cli.import_time_ms('cli')
+    assert cli.cmd_bench(argparse.Namespace(import_budget=cli.IMPORT_BUDGET_MS)) == 1
+    assert 'pulled in numpy' in capsys.readouterr().err
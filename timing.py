@@ -0,0 +1,73 @@
+import gc
+import math
+import statistics
+import time
+from typing import Callable, Dict, List, Tuple, TypeVar
+
+T = TypeVar('T')
+
+DEFAULT_WARMUP = 1
+DEFAULT_REPEATS = 10
+# two-sided 95% Student t critical values by degrees of freedom; larger samples use the normal value
+_T95 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262,
+        10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 25: 2.060, 30: 2.042, 60: 2.000, 120: 1.980}
+
+def t_critical(dof: int) -> float:
+    if dof > max(_T95):
+        return 1.960
+    return _T95[max(k for k in _T95 if k <= dof)]
+
+def measure(func: Callable[[], T], warmup: int = DEFAULT_WARMUP, repeats: int = DEFAULT_REPEATS,
+            disable_gc: bool = False) -> Tuple[T, List[int]]:
+    """Call func warmup times untimed, then repeats times under perf_counter_ns.
+
+    With disable_gc the collector is run before and switched off during each timed call,
+    so a collection triggered by an earlier run cannot land inside a sample.
+    Returns the last result and the samples in nanoseconds.
+    """
+    for _ in range(warmup):
+        func()
+    samples = []
+    result = None
+    gc_was_enabled = gc.isenabled()
+    for _ in range(max(repeats, 1)):
+        if disable_gc:
+            gc.collect()
+            gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            result = func()
+            samples.append(time.perf_counter_ns() - start)
+        finally:
+            if disable_gc and gc_was_enabled:
+                gc.enable()
+    return result, samples
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = q / 100 * (len(ordered) - 1)
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+def summarize_times(samples: List[float]) -> Dict[str, float]:
+    """min/median/mean/stdev and the 95% confidence interval of the mean, in the samples' unit."""
+    mean = statistics.mean(samples)
+    stdev = statistics.stdev(samples) if len(samples) > 1 else 0.0
+    half_width = t_critical(len(samples) - 1) * stdev / math.sqrt(len(samples)) if len(samples) > 1 else 0.0
+    return {
+        'runs': len(samples),
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': mean,
+        'stdev': stdev,
+        'ci_low': mean - half_width,
+        'ci_high': mean + half_width
+    }
+
+def format_summary(summary: Dict[str, float], scale: float = 1e3, unit: str = 'ms') -> str:
+    return (f"min {summary['min'] * scale:.3f} median {summary['median'] * scale:.3f} "
+            f"mean {summary['mean'] * scale:.3f} stdev {summary['stdev'] * scale:.3f} {unit}, "
+            f"95% CI [{summary['ci_low'] * scale:.3f}, {summary['ci_high'] * scale:.3f}] ({summary['runs']} runs)")
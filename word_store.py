@@ -0,0 +1,131 @@
+import bisect
+import hashlib
+import os
+import struct
+from typing import Dict, List, Optional
+import numpy as np
+from feedback_matrix import CACHE_DIR
+from word_utils import WORD_LENGTH, load_words
+
+STORE_VERSION = 1
+MAGIC = b'WRDL'
+HEADER = struct.Struct('<4sHHIQQ32s')
+ALPHABET = 26
+BITS_PER_LETTER = 5
+
+def pack_word(word: str) -> int:
+    key = 0
+    for c in word:
+        key = (key << BITS_PER_LETTER) | (ord(c) - ord('a'))
+    return key
+
+def unpack_word(key: int) -> str:
+    letters = []
+    for _ in range(WORD_LENGTH):
+        key, code = divmod(int(key), 1 << BITS_PER_LETTER)
+        letters.append(chr(code + ord('a')))
+    return ''.join(reversed(letters))
+
+class WordStore:
+    """Word list compiled to 25-bit packed words, loaded zero-copy with mmap.
+
+    Layout after the header: overall letter counts (26 x uint32), positional letter
+    counts (5 x 26 x uint32), packed words in file order, packed words sorted, and
+    the file position of each sorted word.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        raw = np.memmap(path, dtype=np.uint8, mode='r')
+        magic, version, _, count, self.source_size, self.source_mtime_ns, self.source_sha256 = \
+            HEADER.unpack(raw[:HEADER.size].tobytes())
+        if magic != MAGIC or version != STORE_VERSION:
+            raise ValueError(f"{path} is not a version {STORE_VERSION} word store")
+        body = raw[HEADER.size:].view(np.uint32)
+        sections = np.cumsum([0, ALPHABET, WORD_LENGTH * ALPHABET, count, count, count])
+        self.letter_counts = body[sections[0]:sections[1]]
+        self.position_counts = body[sections[1]:sections[2]].reshape(WORD_LENGTH, ALPHABET)
+        self.packed = body[sections[2]:sections[3]]
+        self.sorted_keys = body[sections[3]:sections[4]]
+        self.sorted_positions = body[sections[4]:sections[5]]
+        self._keys = memoryview(self.sorted_keys)
+
+    @staticmethod
+    def compile(text_path: str, store_path: str):
+        with open(text_path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).digest()
+        words = load_words(text_path)
+        stat = os.stat(text_path)
+        letters = np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8).reshape(-1, WORD_LENGTH) - ord('a')
+        letter_counts = np.bincount(letters.ravel(), minlength=ALPHABET).astype(np.uint32)
+        position_counts = np.stack([np.bincount(letters[:, i], minlength=ALPHABET)
+                                    for i in range(WORD_LENGTH)]).astype(np.uint32)
+        packed = np.zeros(len(words), dtype=np.uint32)
+        for i in range(WORD_LENGTH):
+            packed = (packed << BITS_PER_LETTER) | letters[:, i]
+        order = np.argsort(packed, kind='stable').astype(np.uint32)
+        header = HEADER.pack(MAGIC, STORE_VERSION, 0, len(words), stat.st_size, stat.st_mtime_ns, digest)
+        os.makedirs(os.path.dirname(store_path) or '.', exist_ok=True)
+        tmp = f"{store_path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(header)
+            for array in (letter_counts, position_counts, packed, packed[order], order):
+                f.write(array.astype('<u4').tobytes())
+        os.replace(tmp, store_path)
+
+    @classmethod
+    def open(cls, text_path: str = 'five_letter_words.txt', cache_dir: Optional[str] = None) -> 'WordStore':
+        name = f"{os.path.basename(text_path)}.v{STORE_VERSION}.bin"
+        store_path = os.path.join(cache_dir or CACHE_DIR, name)
+        stat = os.stat(text_path)
+        if os.path.exists(store_path):
+            try:
+                store = cls(store_path)
+                if (store.source_size, store.source_mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+                    return store
+                with open(text_path, 'rb') as f:
+                    if hashlib.sha256(f.read()).digest() == store.source_sha256:
+                        return store
+            except (OSError, ValueError, struct.error):
+                pass
+        cls.compile(text_path, store_path)
+        return cls(store_path)
+
+    def __len__(self) -> int:
+        return len(self.packed)
+
+    def __contains__(self, word: str) -> bool:
+        return self.index(word) >= 0
+
+    def index(self, word: str) -> int:
+        """File position of word, or -1; binary search over the sorted keys."""
+        if len(word) != WORD_LENGTH or not word.isascii() or not word.isalpha() or not word.islower():
+            return -1
+        key = pack_word(word)
+        pos = bisect.bisect_left(self._keys, key)
+        if pos < len(self._keys) and self._keys[pos] == key:
+            return int(self.sorted_positions[pos])
+        return -1
+
+    def word(self, index: int) -> str:
+        return unpack_word(self.packed[index])
+
+    def word_list(self) -> List[str]:
+        """Every word as str, in file order; built on each call, the store keeps no copy."""
+        letters = np.empty((len(self.packed), WORD_LENGTH), dtype=np.uint8)
+        packed = np.array(self.packed)
+        for i in reversed(range(WORD_LENGTH)):
+            letters[:, i] = (packed & ((1 << BITS_PER_LETTER) - 1)) + ord('a')
+            packed >>= BITS_PER_LETTER
+        text = letters.tobytes().decode('ascii')
+        return [text[i:i + WORD_LENGTH] for i in range(0, len(text), WORD_LENGTH)]
+
+    def letter_frequencies(self) -> Dict[str, int]:
+        return {chr(ord('a') + i): int(count) for i, count in enumerate(self.letter_counts) if count}
+
+    def position_frequency(self, position: int, letter: str) -> int:
+        return int(self.position_counts[position, ord(letter) - ord('a')])
+
+    @property
+    def nbytes(self) -> int:
+        return os.path.getsize(self.path)
@@ -0,0 +1,51 @@
+import hashlib
+from collections import Counter
+from typing import List, Dict, Tuple
+
+WORD_LENGTH = 5
+SOLVED_FEEDBACK = 'ggggg'
+
+def load_words(path: str = 'five_letter_words.txt') -> List[str]:
+    with open(path) as f:
+        return [line.strip().lower() for line in f if len(line.strip()) == WORD_LENGTH]
+
+def words_hash(words: List[str]) -> str:
+    return hashlib.sha256('\n'.join(words).encode()).hexdigest()
+
+def get_feedback(secret: str, guess: str) -> str:
+    feedback = ['b'] * WORD_LENGTH
+    remaining = Counter()
+    for i, (s, g) in enumerate(zip(secret, guess)):
+        if s == g:
+            feedback[i] = 'g'
+        else:
+            remaining[s] += 1
+    for i, g in enumerate(guess):
+        if feedback[i] != 'g' and remaining[g] > 0:
+            feedback[i] = 'y'
+            remaining[g] -= 1
+    return ''.join(feedback)
+
+def get_letter_frequencies(words: List[str]) -> Dict[str, int]:
+    return dict(Counter(''.join(words)))
+
+def filter_words(words, guess, feedback, matrix=None):
+    if matrix is not None:
+        return matrix.filter(words, guess, feedback)
+    return [word for word in words if get_feedback(word, guess) == feedback]
+
+def split_words(words: List[str], guess: str, feedback: str) -> Tuple[List[str], List[str]]:
+    """(kept, removed): filter_words and its complement from one pass."""
+    kept, removed = [], []
+    for word in words:
+        (kept if get_feedback(word, guess) == feedback else removed).append(word)
+    return kept, removed
+
+def calculate_heuristic(word: str, letter_freq: Dict[str, int]) -> float:
+    return sum(letter_freq.get(c, 0) for c in set(word))
+
+def calculate_positional_heuristic(word: str, position_freq: List[Dict[str, int]]) -> float:
+    return sum(position_freq[i].get(c, 0) for i, c in enumerate(word))
+
+def calculate_g_cost(guesses: List[str]) -> float:
+    return len(guesses)